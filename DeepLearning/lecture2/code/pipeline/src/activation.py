@@ -1,3 +1,104 @@
 import numpy as np
-def sigmoid(X):
-    return 1/(1+np.exp(-X))
+
+from profiling import profiled
+
+"""
+Activation functions and their derivatives.
+
+Every function accepts an `out=` array (it may be the input itself) and
+then writes the result there without allocating, so a training loop can
+reuse the same buffer on every iteration. With out=None a new array is
+returned, like before.
+
+Derivatives take what backprop has at hand: sigmoid_derivative and
+tanh_derivative take the activation output, relu_derivative and
+log_sigmoid_derivative the input.
+"""
+
+
+def _buffer(X, out):
+    # Output array for X: out itself, or a new float array of X's shape
+    if out is not None:
+        return out
+    X = np.asarray(X)
+    return np.empty(X.shape, dtype=X.dtype if X.dtype.kind == "f" else np.float64)
+
+
+def _result(out):
+    # Scalars in, scalars out
+    return out[()] if out.ndim == 0 else out
+
+
+@profiled()
+def sigmoid(X, out=None):
+    # 1/(1+exp(-X)). For very negative X exp(-X) overflows to inf, which
+    # still gives the correct limit 1/inf = 0, so only the warning is silenced.
+    out = np.negative(X, out=_buffer(X, out))
+    with np.errstate(over="ignore"):
+        np.exp(out, out=out)
+    out += 1
+    np.reciprocal(out, out=out)
+    return _result(out)
+
+
+def sigmoid_derivative(S, out=None):
+    # S is sigmoid(X); derivative S * (1 - S). out must not be S.
+    if out is S:
+        raise ValueError("sigmoid_derivative can not write into its input")
+    out = np.subtract(1, S, out=_buffer(S, out))
+    out *= S
+    return _result(out)
+
+
+def tanh(X, out=None):
+    return _result(np.tanh(X, out=_buffer(X, out)))
+
+
+def tanh_derivative(T, out=None):
+    # T is tanh(X); derivative 1 - T^2
+    out = np.multiply(T, T, out=_buffer(T, out))
+    np.subtract(1, out, out=out)
+    return _result(out)
+
+
+def relu(X, out=None):
+    return _result(np.maximum(X, 0, out=_buffer(X, out)))
+
+
+def relu_derivative(X, out=None):
+    # 1 where X > 0, else 0
+    return _result(np.greater(X, 0, out=_buffer(X, out)))
+
+
+def softmax(X, axis=-1, out=None):
+    # Subtracting the row maximum keeps exp from overflowing
+    out = np.subtract(X, np.max(X, axis=axis, keepdims=True), out=_buffer(X, out))
+    np.exp(out, out=out)
+    out /= np.sum(out, axis=axis, keepdims=True)
+    return _result(out)
+
+
+def softmax_backward(S, grad, axis=-1, out=None):
+    # S is softmax(X), grad is dE/dS; returns dE/dX = S * (grad - sum(grad * S))
+    dot = np.sum(grad * S, axis=axis, keepdims=True)
+    out = np.subtract(grad, dot, out=_buffer(grad, out))
+    out *= S
+    return _result(out)
+
+
+def log_sigmoid(X, out=None):
+    # log(sigmoid(X)) = min(X, 0) - log1p(exp(-|X|)), exact for any X
+    # min(X, 0) is kept apart, out may be X itself
+    low = np.minimum(X, 0)
+    out = np.abs(X, out=_buffer(X, out))
+    np.negative(out, out=out)
+    np.exp(out, out=out)
+    np.log1p(out, out=out)
+    np.subtract(low, out, out=out)
+    return _result(out)
+
+
+def log_sigmoid_derivative(X, out=None):
+    # d/dX log(sigmoid(X)) = 1 - sigmoid(X) = sigmoid(-X)
+    out = np.negative(X, out=_buffer(X, out))
+    return sigmoid(out, out=out)
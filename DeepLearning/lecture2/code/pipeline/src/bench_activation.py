@@ -0,0 +1,69 @@
+import argparse
+import timeit
+import warnings
+
+import numpy as np
+
+from activation import sigmoid, tanh, relu, softmax, log_sigmoid
+
+
+def legacy_sigmoid(X):
+    # The previous activation.sigmoid
+    return 1/(1+np.exp(-X))
+
+
+def bench(fn, repeat, number):
+    return min(timeit.repeat(fn, repeat=repeat, number=number)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the activation kernels with the old sigmoid")
+    parser.add_argument("--n", type=int, default=1_000_000, help="number of elements")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=20)
+    parser.add_argument("--dtype", default="float64")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    X = (rng.standard_normal(args.n) * 10).astype(args.dtype)
+    out = np.empty_like(X)
+
+    # Correctness and overflow on extreme inputs
+    extreme = np.array([-1000.0, -50.0, 0.0, 50.0, 1000.0], dtype=args.dtype)
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        legacy_sigmoid(extreme)
+    print(f"legacy sigmoid warnings on {extreme.tolist()}: {len(caught)}")
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        sigmoid(extreme)
+        log_sigmoid(extreme)
+    print(f"new sigmoid/log_sigmoid warnings: {len(caught)}")
+    print(f"log_sigmoid({extreme.tolist()}) = {log_sigmoid(extreme).tolist()}")
+
+    with np.errstate(over="ignore"):
+        error = np.max(np.abs(sigmoid(X) - legacy_sigmoid(X)))
+    print(f"max |new - legacy| sigmoid: {error:.3g}\n")
+
+    cases = [
+        ("legacy sigmoid", lambda: legacy_sigmoid(X)),
+        ("sigmoid", lambda: sigmoid(X)),
+        ("sigmoid out=", lambda: sigmoid(X, out=out)),
+        ("tanh out=", lambda: tanh(X, out=out)),
+        ("relu out=", lambda: relu(X, out=out)),
+        ("softmax out=", lambda: softmax(X.reshape(-1, 10), out=out.reshape(-1, 10))),
+        ("log_sigmoid out=", lambda: log_sigmoid(X, out=out)),
+    ]
+
+    with np.errstate(over="ignore"):
+        baseline = bench(cases[0][1], args.repeat, args.number)
+        print(f"{'kernel':<18}{'ms/call':>10}{'vs legacy':>12}")
+        for name, fn in cases:
+            seconds = bench(fn, args.repeat, args.number)
+            # Only the sigmoid kernels compute the same thing as the legacy one
+            speedup = f"{baseline / seconds:>11.2f}x" if "sigmoid" in name and "log" not in name else ""
+            print(f"{name:<18}{seconds * 1000:>10.3f}{speedup}")
+
+
+if __name__ == "__main__":
+    main()
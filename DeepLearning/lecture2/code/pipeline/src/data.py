@@ -1,26 +1,145 @@
 # data_utils.py
 
-import pandas as pd
+import queue
+import threading
+
 import numpy as np
 
-def prepare_features_and_target(data):
+def prepare_features_and_target(data, dtype=np.float64):
     """
-    Converts sklearn dataset to DataFrame and extracts features and target.
+    Extracts features and target from an sklearn dataset.
 
     Parameters:
         data: sklearn.utils.Bunch
             A dataset object with 'data', 'target', and 'feature_names'.
+        dtype: numpy dtype
+            dtype of the features.
 
     Returns:
         X: np.ndarray
-            Features as a NumPy array.
+            Features as one C-contiguous NumPy array (no copy when
+            data['data'] already is one of the right dtype).
         y: np.ndarray
             Target as a NumPy array.
     """
-    df = pd.DataFrame(data=data['data'], columns=data.feature_names)
-    df['target'] = data['target']
-
-    X = df.iloc[:, :-1].values
-    y = df['target'].values
+    X = np.ascontiguousarray(data['data'], dtype=dtype)
+    y = np.asarray(data['target'])
 
     return X, y
+
+
+class BatchLoader:
+    """
+    Yields (X_batch, y_batch) mini-batches, one epoch per iteration.
+
+    Without shuffling every batch is a view into X and y, no data is copied.
+    With shuffling a background thread gathers the rows of the next batches
+    into a small ring of preallocated contiguous buffers while the current
+    batch is being used, so the training loop never waits for the copy.
+
+    A yielded batch stays valid until the next batch is requested.
+
+    Example:
+        loader = BatchLoader(X, y, batch_size=64, seed=0)
+        for epoch in range(10):
+            for X_batch, y_batch in loader:
+                model.partial_fit(X_batch, y_batch)
+    """
+
+    def __init__(self, X, y, batch_size=32, shuffle=True, seed=None, prefetch=2, drop_last=False):
+        """
+        X, y       : features (n_samples, n_features) and targets (n_samples,)
+        batch_size : rows per batch
+        shuffle    : new random order every epoch
+        seed       : seed of the shuffling
+        prefetch   : number of batches prepared ahead (0 = no thread)
+        drop_last  : skip the last batch when it is smaller than batch_size
+        """
+        self.X = np.ascontiguousarray(X)
+        self.y = np.ascontiguousarray(y)
+        if len(self.X) != len(self.y):
+            raise ValueError("X and y must have the same number of rows")
+
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.prefetch = prefetch
+        self.drop_last = drop_last
+        self.rng = np.random.default_rng(seed)
+
+        # One buffer for the batch in use, `prefetch` waiting, one being filled
+        n_buffers = prefetch + 2
+        self._X_buffers = [np.empty((batch_size,) + self.X.shape[1:], dtype=self.X.dtype) for _ in range(n_buffers)]
+        self._y_buffers = [np.empty((batch_size,) + self.y.shape[1:], dtype=self.y.dtype) for _ in range(n_buffers)]
+
+    def __len__(self):
+        n = len(self.X)
+        return n // self.batch_size if self.drop_last else -(-n // self.batch_size)
+
+    def _batches(self, order):
+        # (X_batch, y_batch) for every batch of this epoch
+        n = len(self.X)
+        stop = n - n % self.batch_size if self.drop_last else n
+
+        for i, start in enumerate(range(0, stop, self.batch_size)):
+            end = min(start + self.batch_size, n)
+
+            if order is None:
+                yield self.X[start:end], self.y[start:end]
+                continue
+
+            rows = order[start:end]
+            slot = i % len(self._X_buffers)
+            X_batch = self._X_buffers[slot][:len(rows)]
+            y_batch = self._y_buffers[slot][:len(rows)]
+            np.take(self.X, rows, axis=0, out=X_batch)
+            np.take(self.y, rows, axis=0, out=y_batch)
+            yield X_batch, y_batch
+
+    def __iter__(self):
+        order = self.rng.permutation(len(self.X)) if self.shuffle else None
+        batches = self._batches(order)
+
+        # Views need no preparation, so only shuffled batches use the thread
+        if order is None or self.prefetch == 0:
+            yield from batches
+            return
+
+        ready = queue.Queue(maxsize=self.prefetch)
+        stop = threading.Event()
+        done = object()
+
+        def send(item):
+            # Wait for room in the queue, unless the consumer has stopped
+            while not stop.is_set():
+                try:
+                    ready.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def worker():
+            try:
+                for batch in batches:
+                    if not send(batch):
+                        return
+            except Exception as error:
+                send(error)
+            else:
+                send(done)
+
+        thread = threading.Thread(target=worker, daemon=True)
+        thread.start()
+
+        try:
+            while True:
+                batch = ready.get()
+                if batch is done:
+                    break
+                if isinstance(batch, Exception):
+                    raise batch
+                yield batch
+        finally:
+            # Also runs when the consumer stops early
+            stop.set()
+            thread.join()
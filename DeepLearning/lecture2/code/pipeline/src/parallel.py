@@ -0,0 +1,132 @@
+import os
+from multiprocessing import Pool, shared_memory
+
+import numpy as np
+
+from profiling import stage
+
+"""
+Data-parallel perceptron training on several cores.
+
+X and y are copied once into shared memory, so the worker processes read
+them without any pickling. Every step the current weights (and bias) are
+written into a small shared array, each worker computes the partial
+gradient of its slice of the batch:
+
+    dw_k = X_k^T (z_k - y_k)      db_k = sum(z_k - y_k)
+
+and the main process adds them up and applies the same update as
+Perceptron.fit. The result is identical to single-core training; only
+the gradient sums are computed in parallel.
+
+Every step costs one round trip to the pool, so the batches must be
+large (thousands of rows per worker) for the time per epoch to scale
+with the number of cores.
+"""
+
+# Views into the shared arrays, set in every worker by _attach
+_shared = {}
+
+
+def _share(array):
+    # Copy array into a new shared memory block and return (block, view)
+    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    view = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+    view[...] = array
+    return block, view
+
+
+def _attach(specs):
+    # Pool initializer: map the shared blocks into this worker
+    for name, (block_name, shape, dtype) in specs.items():
+        block = shared_memory.SharedMemory(name=block_name)
+        _shared[name] = (block, np.ndarray(shape, dtype=dtype, buffer=block.buf))
+
+
+def _partial_gradient(rows):
+    # Gradient sums of the rows [start, stop) with the current parameters
+    start, stop = rows
+    X = _shared["X"][1][start:stop]
+    y = _shared["y"][1][start:stop]
+    params = _shared["params"][1]
+
+    z = np.dot(X, params[:-1])
+    z += params[-1]
+    residual = (z >= 0).astype(np.float64)
+    residual -= y
+
+    return np.dot(residual, X), residual.sum()
+
+
+def fit_parallel(model, X, y, epochs=None, batch_size=None, n_workers=None):
+    """
+    Train a Perceptron with its gradients computed by a process pool.
+
+    model      : Perceptron, its lr is used and its weights/bias are updated
+                 (training continues from them when already set)
+    X, y       : training data
+    epochs     : number of passes over the data (model.epochs when None)
+    batch_size : rows per update (None = the full data, like Perceptron.fit)
+    n_workers  : number of processes (os.cpu_count() when None)
+
+    There is no early stopping in this mode, every epoch is run.
+    """
+    X = np.ascontiguousarray(X, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64).reshape(-1)
+    n, n_features = X.shape
+
+    epochs = model.epochs if epochs is None else epochs
+    batch_size = n if batch_size is None else min(batch_size, n)
+    n_workers = n_workers or os.cpu_count()
+
+    if model.weights is None:
+        model.weights = np.zeros(n_features)
+
+    params = np.zeros(n_features + 1)
+
+    blocks = []
+    try:
+        shared = {}
+        for name, array in (("X", X), ("y", y), ("params", params)):
+            block, view = _share(array)
+            blocks.append(block)
+            shared[name] = view
+        params = shared["params"]
+
+        specs = {name: (block.name, view.shape, view.dtype) for (name, view), block in zip(shared.items(), blocks)}
+
+        with Pool(n_workers, initializer=_attach, initargs=(specs,)) as pool:
+
+            for _ in range(epochs):
+                for start in range(0, n, batch_size):
+                    stop = min(start + batch_size, n)
+
+                    # Split the batch into one slice per worker
+                    bounds = np.linspace(start, stop, n_workers + 1).astype(int)
+                    slices = [(a, b) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+
+                    # Publish the parameters, workers compute their partial gradients
+                    with stage("dispatch", samples=stop - start):
+                        params[:-1] = model.weights
+                        params[-1] = model.bais
+                        parts = pool.map(_partial_gradient, slices)
+
+                    # Sum the partial gradients and update in the main process
+                    with stage("reduce", samples=stop - start):
+                        dw = np.zeros(n_features)
+                        db = 0.0
+                        for part_dw, part_db in parts:
+                            dw += part_dw
+                            db += part_db
+
+                        step = model.lr / (stop - start)
+                        model.weights -= step * dw
+                        model.bais -= step * db
+
+        model.n_epochs = epochs
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+    return model
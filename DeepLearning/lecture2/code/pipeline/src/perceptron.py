@@ -1,35 +1,158 @@
 import numpy as np
 from activation import sigmoid
+from profiling import profiled, stage
+@profiled()
 def update_weights(weights,X,z,y,lr):
     m=len(y)
-    
+
     dw=(1/m)*np.dot(X.T,(z-y))
-    
+
     weights=weights-lr*dw
-    
+
     return weights
+@profiled()
 def update_bais(bais,X,z,y,lr):
     m=len(y)
-    
+
     db=(1/m)*np.sum(z-y)
     bais=bais-lr*db
     return bais
+@profiled()
+def predict_proba(X,weights,bais,out=None):
+    # sigmoid(X.w + b), written into out when it is given
+    z=np.dot(X,weights,out=out)
+    z+=bais
+    return sigmoid(z,out=out)
+@profiled()
+def predict(X,weights,bais):
+    # sigmoid(z) >= 0.5 exactly when z >= 0, so the labels need no sigmoid
+    z=np.dot(X,weights)
+    z+=bais
+    return (z>=0).astype(np.int8)
 def perceptron(X,weights,bais):
-    z=np.dot(X,weights)+bais
-    
-    y_pred=sigmoid(z)
-    
-    y_p=[1 if y>=0.5 else 0  for y in y_pred ]
-     
-    """ 
-    y_p=[]
-    for y in y_pred:
-        if y>=0.5:
-            y_p.append(1)
-            
-        else:
-            y_p.append(0)
-            
+    # Labels (0/1) as an int8 array, same as predict
+    return predict(X,weights,bais)
+
+
+class Perceptron:
     """
+    Perceptron trainer that keeps its weights, bias and work buffers.
+
+    Every step computes the predicted labels and the residual (z - y) once
+    and updates the weights and the bias together in place, with the same
+    rule as update_weights / update_bais:
+        w -= lr/m * X^T (z - y)
+        b -= lr/m * sum(z - y)
+
+    Training stops early when the accuracy on a held-out split has not
+    improved for `patience` epochs; the best weights are then restored.
+    """
+
+    def __init__(self,lr=0.001,epochs=10000,patience=500,tol=0.0,validation_fraction=0.2,seed=None):
+        """
+        lr                  : learning rate
+        epochs              : maximum number of epochs (full-batch steps)
+        patience            : epochs without validation improvement before stopping
+                              (None = always run all epochs)
+        tol                 : minimum accuracy gain that counts as an improvement
+        validation_fraction : part of the training data held out when fit gets
+                              no X_val / y_val (0 = no early stopping)
+        seed                : seed of the held-out split
+        """
+        self.lr=lr
+        self.epochs=epochs
+        self.patience=patience
+        self.tol=tol
+        self.validation_fraction=validation_fraction
+        self.seed=seed
+
+        self.weights=None
+        self.bais=0.0
+        self.n_epochs=0
+        self.val_history=[]
+
+    def _split(self,X,y):
+        n_val=int(len(y)*self.validation_fraction)
+        if n_val==0:
+            return X,y,None,None
+        order=np.random.default_rng(self.seed).permutation(len(y))
+        val,train=order[:n_val],order[n_val:]
+        return X[train],y[train],X[val],y[val]
+
+    def fit(self,X,y,X_val=None,y_val=None):
+        X=np.ascontiguousarray(X,dtype=np.float64)
+        y=np.asarray(y).reshape(-1)
+
+        if X_val is None and self.patience is not None:
+            X,y,X_val,y_val=self._split(X,y)
+        X_val_labels=None if y_val is None else np.asarray(y_val).reshape(-1)
+
+        m,n_features=X.shape
+        self.weights=np.zeros(n_features)
+        self.bais=0.0
+        self.val_history=[]
+
+        # Buffers reused by every step
+        z=np.empty(m)
+        labels=np.empty(m,dtype=np.int8)
+        residual=np.empty(m)
+        dw=np.empty(n_features)
+        step=self.lr/m
+
+        best=(-1.0,self.weights.copy(),self.bais)
+        since_best=0
+        self.n_epochs=0
+
+        for _ in range(self.epochs):
+            self.n_epochs+=1
+
+            with stage("forward",samples=m):
+                np.dot(X,self.weights,out=z)
+                z+=self.bais
+                np.greater_equal(z,0,out=labels)
+                np.subtract(labels,y,out=residual)
+
+            with stage("update",samples=m):
+                np.dot(residual,X,out=dw)
+                dw*=step
+                self.weights-=dw
+                self.bais-=step*residual.sum()
+
+            if X_val_labels is None:
+                continue
+
+            with stage("validation",samples=len(X_val_labels)):
+                accuracy=np.count_nonzero(self.predict(X_val)==X_val_labels)/len(X_val_labels)
+            self.val_history.append(accuracy)
+
+            if accuracy>best[0]+self.tol:
+                best=(accuracy,self.weights.copy(),self.bais)
+                since_best=0
+            else:
+                since_best+=1
+                if self.patience is not None and since_best>=self.patience:
+                    break
+
+        if X_val_labels is not None:
+            self.weights,self.bais=best[1],best[2]
+
+        return self
+
+    def partial_fit(self,X,y):
+        # One update on a mini-batch, e.g. from data.BatchLoader
+        X=np.asarray(X,dtype=np.float64)
+        if self.weights is None:
+            self.weights=np.zeros(X.shape[1])
+
+        residual=predict(X,self.weights,self.bais)-np.asarray(y).reshape(-1)
+        step=self.lr/len(residual)
+
+        self.weights-=step*np.dot(residual,X)
+        self.bais-=step*residual.sum()
+        return self
+
+    def predict_proba(self,X,out=None):
+        return predict_proba(X,self.weights,self.bais,out=out)
 
-    return y_p
\ No newline at end of file
+    def predict(self,X):
+        return predict(X,self.weights,self.bais)
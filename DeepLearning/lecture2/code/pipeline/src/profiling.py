@@ -0,0 +1,203 @@
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+
+"""
+Training-loop profiling, off by default.
+
+Code is instrumented with named stages:
+
+    with stage("step", samples=len(y)):
+        ...
+
+    @profiled("update_weights")
+    def update_weights(...):
+
+While profiling is disabled, stage() returns a shared no-op context and
+a profiled function only checks one flag, so the instrumentation can
+stay in the training loop. After enable() every stage records its call
+count, total / min / max time and the number of samples it processed
+(for throughput); with enable(track_allocations=True) also the bytes
+allocated per call through tracemalloc (slower). These are bytes (the
+peak of traced memory above the level at entry), not a count of
+allocations: tracemalloc does not count the blocks that were allocated
+and freed again inside a stage.
+
+Results: report() prints a table, save_json() writes the summary and
+save_chrome_trace() writes a trace for chrome://tracing / Perfetto.
+"""
+
+
+class _NullStage:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    def __init__(self, profiler, name, samples):
+        self.profiler = profiler
+        self.name = name
+        self.samples = samples
+
+    def __enter__(self):
+        profiler = self.profiler
+        if profiler.track_allocations:
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            profiler._memory_stack.append([current, current])
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter_ns()
+        profiler = self.profiler
+
+        allocated = 0
+        if profiler.track_allocations and profiler._memory_stack:
+            start_memory, peak = profiler._memory_stack.pop()
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+            allocated = peak - start_memory
+            # An enclosing stage has to see this stage's peak as well
+            if profiler._memory_stack:
+                outer = profiler._memory_stack[-1]
+                outer[1] = max(outer[1], peak)
+
+        profiler._record(self.name, self.start, end, self.samples, allocated)
+        return False
+
+
+class Profiler:
+
+    def __init__(self):
+        self.enabled = False
+        self.track_allocations = False
+        self.stats = {}
+        self.events = []
+        self.max_events = 1_000_000
+        self._memory_stack = []
+        self._origin = time.perf_counter_ns()
+
+    def enable(self, track_allocations=False):
+        self.enabled = True
+        self.track_allocations = track_allocations
+        if track_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def disable(self):
+        self.enabled = False
+        if self.track_allocations:
+            tracemalloc.stop()
+            self.track_allocations = False
+
+    def reset(self):
+        self.stats = {}
+        self.events = []
+        self._memory_stack = []
+        self._origin = time.perf_counter_ns()
+
+    def stage(self, name, samples=0):
+        if not self.enabled:
+            return _NULL_STAGE
+        return _Stage(self, name, samples)
+
+    def _record(self, name, start, end, samples, allocated):
+        duration = end - start
+
+        stat = self.stats.get(name)
+        if stat is None:
+            stat = self.stats[name] = {"calls": 0, "total_ns": 0, "min_ns": duration, "max_ns": duration,
+                                       "samples": 0, "alloc_bytes": 0, "peak_alloc_bytes": 0}
+        stat["calls"] += 1
+        stat["total_ns"] += duration
+        stat["min_ns"] = min(stat["min_ns"], duration)
+        stat["max_ns"] = max(stat["max_ns"], duration)
+        stat["samples"] += samples
+        stat["alloc_bytes"] += allocated
+        stat["peak_alloc_bytes"] = max(stat["peak_alloc_bytes"], allocated)
+
+        if len(self.events) < self.max_events:
+            self.events.append((name, start, duration, threading.get_ident()))
+
+    def summary(self):
+        """
+        Per-stage statistics in seconds, sorted by total time.
+
+        With allocation tracking, alloc_bytes_per_call and peak_alloc_bytes
+        are sizes in bytes, not numbers of allocations.
+        """
+        result = {}
+        for name, stat in sorted(self.stats.items(), key=lambda item: -item[1]["total_ns"]):
+            total = stat["total_ns"] / 1e9
+            entry = {
+                "calls": stat["calls"],
+                "total_s": total,
+                "mean_s": total / stat["calls"],
+                "min_s": stat["min_ns"] / 1e9,
+                "max_s": stat["max_ns"] / 1e9,
+                "samples": stat["samples"],
+                "samples_per_s": stat["samples"] / total if stat["samples"] and total > 0 else None,
+            }
+            if self.track_allocations or stat["alloc_bytes"]:
+                entry["alloc_bytes_per_call"] = stat["alloc_bytes"] / stat["calls"]
+                entry["peak_alloc_bytes"] = stat["peak_alloc_bytes"]
+            result[name] = entry
+        return result
+
+    def report(self):
+        print(f"{'stage':<20}{'calls':>9}{'total ms':>11}{'mean us':>10}{'samples/s':>13}{'alloc B/call':>14}")
+        for name, entry in self.summary().items():
+            rate = f"{entry['samples_per_s']:.3g}" if entry["samples_per_s"] else "-"
+            alloc = f"{entry['alloc_bytes_per_call']:.0f}" if "alloc_bytes_per_call" in entry else "-"
+            print(f"{name:<20}{entry['calls']:>9}{entry['total_s'] * 1e3:>11.2f}"
+                  f"{entry['mean_s'] * 1e6:>10.2f}{rate:>13}{alloc:>14}")
+
+    def save_json(self, path):
+        with open(path, "w") as f:
+            json.dump({"stages": self.summary()}, f, indent=2)
+
+    def save_chrome_trace(self, path):
+        """
+        Write the recorded stages as complete ("X") events, in microseconds.
+        """
+        pid = os.getpid()
+        events = [
+            {"name": name, "ph": "X", "ts": (start - self._origin) / 1e3, "dur": duration / 1e3,
+             "pid": pid, "tid": tid}
+            for name, start, duration, tid in self.events
+        ]
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+
+# The profiler used by stage() and profiled()
+profiler = Profiler()
+
+
+# stage(name, samples=0): bound directly to save a call in hot loops
+stage = profiler.stage
+
+
+def profiled(name=None):
+    """
+    Decorator: time every call of the function as a stage.
+    """
+    def decorate(fn):
+        label = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not profiler.enabled:
+                return fn(*args, **kwargs)
+            with _Stage(profiler, label, 0):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
@@ -1,25 +1,52 @@
-from data import prepare_features_and_target
-import pandas as pd 
-import numpy as np
-from perceptron import *
-from activation import sigmoid
-from tqdm import tqdm
+from data import prepare_features_and_target, BatchLoader
+from perceptron import Perceptron
 from eval import accuarcy
 from sklearn.datasets import load_breast_cancer
 from sklearn.model_selection import train_test_split 
 import warnings  
 warnings.filterwarnings('ignore')
-data=load_breast_cancer()
-X, y = prepare_features_and_target(data)
-train_X,test_X,train_y,test_y=train_test_split(X,y,test_size=0.2)
-lr=0.001
-weights=np.zeros(train_X.shape[1]) #30 zero for 30 weight
-bais=0
-for i in tqdm(range(10000), desc="Training"):
-    pred = perceptron(train_X, weights, bais)
-    weights = update_weights(weights, train_X, pred, train_y, lr)
-    bais = update_bais(bais, train_X, pred, train_y, lr)
-y_pred=perceptron(test_X,weights,bais)
-print("Test_Accuarcy : " ,accuarcy(y_pred,test_y))
-y_pred=perceptron(train_X,weights,bais)
-print("Train_Accuarcy : " ,accuarcy(y_pred,train_y))
\ No newline at end of file
+from parallel import fit_parallel
+from profiling import profiler, stage
+import argparse
+
+if __name__ == "__main__":
+    parser=argparse.ArgumentParser()
+    parser.add_argument("--workers",type=int,default=0,help="train on this many processes (0 = single core with early stopping)")
+    parser.add_argument("--batch-size",type=int,default=None,help="rows per update; on a single core this trains on shuffled mini-batches without early stopping (default: all rows)")
+    parser.add_argument("--profile",metavar="JSON",help="profile the training and write the per-stage summary here")
+    parser.add_argument("--trace",metavar="JSON",help="also write a Chrome trace (chrome://tracing) here")
+    parser.add_argument("--track-allocations",action="store_true",help="also measure the bytes allocated per stage (slower)")
+    args=parser.parse_args()
+
+    if args.profile or args.trace:
+        profiler.enable(track_allocations=args.track_allocations)
+
+    data=load_breast_cancer()
+    X, y = prepare_features_and_target(data)
+    train_X,test_X,train_y,test_y=train_test_split(X,y,test_size=0.2)
+    model=Perceptron(lr=0.001,epochs=10000,patience=500)
+    if args.workers:
+        fit_parallel(model,train_X,train_y,batch_size=args.batch_size,n_workers=args.workers)
+    elif args.batch_size:
+        # Mini-batch training: the loader prepares the next shuffled batch
+        # on a background thread while partial_fit runs on the current one
+        loader=BatchLoader(train_X,train_y,batch_size=args.batch_size,seed=0)
+        for epoch in range(model.epochs):
+            for X_batch,y_batch in loader:
+                with stage("batch",samples=len(y_batch)):
+                    model.partial_fit(X_batch,y_batch)
+        model.n_epochs=model.epochs
+    else:
+        model.fit(train_X,train_y)
+    print("Epochs : ",model.n_epochs)
+    y_pred=model.predict(test_X)
+    print("Test_Accuarcy : " ,accuarcy(y_pred,test_y))
+    y_pred=model.predict(train_X)
+    print("Train_Accuarcy : " ,accuarcy(y_pred,train_y))
+
+    if profiler.enabled:
+        profiler.report()
+        if args.profile:
+            profiler.save_json(args.profile)
+        if args.trace:
+            profiler.save_chrome_trace(args.trace)
@@ -1,4 +1,5 @@
 import numpy as np
+from network import NeuralNetwork
 
 def sigmoid(x):
     return 1 / (1 + np.exp(-x))
@@ -69,10 +70,11 @@ delta_o2 = dE_dout_o2 * dout_o2_dnet
 dE_dw5 = delta_o1 * out_h1
 w5_new = w5 - lr * dE_dw5
 
-dE_dw6 = delta_o1 * out_h2
+# w6 connects h1 to o2, w7 connects h2 to o1
+dE_dw6 = delta_o2 * out_h1
 w6_new = w6 - lr * dE_dw6
 
-dE_dw7 = delta_o2 * out_h1
+dE_dw7 = delta_o1 * out_h2
 w7_new = w7 - lr * dE_dw7
 
 dE_dw8 = delta_o2 * out_h2
@@ -82,10 +84,10 @@ print("\n" + "=" * 65)
 print("    BACKWARD PASS  (Hidden Layer)")
 print("=" * 65)
 
-dE_dout_h1 = delta_o1 * w5 + delta_o2 * w7
+dE_dout_h1 = delta_o1 * w5 + delta_o2 * w6
 dout_h1_dnet = out_h1 * (1 - out_h1)
 
-dE_dout_h2 = delta_o1 * w6 + delta_o2 * w8
+dE_dout_h2 = delta_o1 * w7 + delta_o2 * w8
 dout_h2_dnet = out_h2 * (1 - out_h2)
 
 dE_dw1 = dE_dout_h1 * dout_h1_dnet * x1
@@ -121,49 +123,22 @@ E_after_1 = 0.5*(target_o1-_o1)**2 + 0.5*(target_o2-_o2)**2
 print("\nError before:", E_total)
 print("Error after:", E_after_1)
 
-w1, w2, w3, w4 = 0.15, 0.20, 0.25, 0.30
-w5, w6, w7, w8 = 0.40, 0.45, 0.50, 0.55
-b1, b2 = 0.35, 0.60
+# Training for 10000 iterations, with the weights stored as matrices.
+# W[0][i, j] connects input i to hidden unit j, W[1][i, j] hidden unit i to output j.
+net = NeuralNetwork([2, 2, 2], lr=lr)
+net.weights[0][...] = [[0.15, 0.20], [0.25, 0.30]]
+net.weights[1][...] = [[0.40, 0.45], [0.50, 0.55]]
+net.biases[0][...] = 0.35
+net.biases[1][...] = 0.60
 
-for i in range(10000):
-    net_h1 = w1*x1 + w3*x2 + b1
-    net_h2 = w2*x1 + w4*x2 + b1
-    out_h1 = sigmoid(net_h1)
-    out_h2 = sigmoid(net_h2)
-
-    net_o1 = w5*out_h1 + w7*out_h2 + b2
-    net_o2 = w6*out_h1 + w8*out_h2 + b2
-    out_o1 = sigmoid(net_o1)
-    out_o2 = sigmoid(net_o2)
-
-    delta_o1 = -(target_o1 - out_o1) * out_o1 * (1 - out_o1)
-    delta_o2 = -(target_o2 - out_o2) * out_o2 * (1 - out_o2)
-
-    w5 -= lr * delta_o1 * out_h1
-    w6 -= lr * delta_o1 * out_h2
-    w7 -= lr * delta_o2 * out_h1
-    w8 -= lr * delta_o2 * out_h2
-    b2 -= lr * (delta_o1 + delta_o2)
-
-    dE_h1 = (delta_o1 * w5 + delta_o2 * w7) * out_h1 * (1 - out_h1)
-    dE_h2 = (delta_o1 * w6 + delta_o2 * w8) * out_h2 * (1 - out_h2)
-
-    w1 -= lr * dE_h1 * x1
-    w2 -= lr * dE_h2 * x1
-    w3 -= lr * dE_h1 * x2
-    w4 -= lr * dE_h2 * x2
-    b1 -= lr * (dE_h1 + dE_h2)
-
-net_h1 = w1*x1 + w3*x2 + b1
-net_h2 = w2*x1 + w4*x2 + b1
-out_h1 = sigmoid(net_h1)
-out_h2 = sigmoid(net_h2)
-net_o1 = w5*out_h1 + w7*out_h2 + b2
-net_o2 = w6*out_h1 + w8*out_h2 + b2
-pred_o1 = sigmoid(net_o1)
-pred_o2 = sigmoid(net_o2)
+X = np.array([[x1, x2]])
+Y = np.array([[target_o1, target_o2]])
+
+net.fit(X, Y, epochs=10000)
+
+pred_o1, pred_o2 = net.predict(X)[0]
 E_final = 0.5*(target_o1-pred_o1)**2 + 0.5*(target_o2-pred_o2)**2
 
 print("\nPrediction o1 =", pred_o1)
 print("Prediction o2 =", pred_o2)
-print("Final Error =", E_final)
\ No newline at end of file
+print("Final Error =", E_final)
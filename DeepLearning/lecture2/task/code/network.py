@@ -0,0 +1,179 @@
+import numpy as np
+
+
+def sigmoid(x, out=None):
+    """
+    Sigmoid computed in place into `out` (a new array when out is None).
+    """
+    out = np.negative(x, out=out)
+    np.exp(out, out=out)
+    out += 1
+    np.reciprocal(out, out=out)
+    return out
+
+
+class NeuralNetwork:
+    """
+    Fully connected network with sigmoid units, trained with backpropagation.
+
+    The same network as BP.py, for any layer sizes: every layer keeps its
+    weights as one (n_in, n_out) matrix, so the forward and backward passes
+    of a whole mini-batch are one matmul per layer instead of one Python
+    expression per weight and sample.
+
+    Error: E = 0.5 * sum((target - out)^2), averaged over the batch.
+
+    Example (the 2-2-2 network of BP.py):
+        net = NeuralNetwork([2, 2, 2], lr=0.5)
+        net.fit(X, Y, epochs=10000)
+    """
+
+    def __init__(self, layer_sizes, lr=0.5, seed=None, dtype=np.float64):
+        """
+        layer_sizes : list of int, e.g. [n_inputs, hidden_1, ..., n_outputs]
+        lr          : learning rate
+        seed        : seed of the random weight initialization
+        dtype       : np.float64 (default) or np.float32
+        """
+        if len(layer_sizes) < 2:
+            raise ValueError("layer_sizes needs at least an input and an output size")
+
+        self.layer_sizes = list(layer_sizes)
+        self.lr = lr
+        self.dtype = np.dtype(dtype)
+
+        rng = np.random.default_rng(seed)
+
+        # Xavier/Glorot uniform initialization keeps sigmoid units out of saturation
+        self.weights = []
+        self.biases = []
+        for n_in, n_out in zip(self.layer_sizes[:-1], self.layer_sizes[1:]):
+            limit = np.sqrt(6 / (n_in + n_out))
+            self.weights.append(rng.uniform(-limit, limit, (n_in, n_out)).astype(self.dtype))
+            self.biases.append(np.zeros(n_out, dtype=self.dtype))
+
+        self.loss_history = []
+
+        # Activation and delta buffers, reused while the batch size stays the same
+        self._batch_size = None
+        self._activations = None
+        self._deltas = None
+
+    def _buffers(self, n):
+        if self._batch_size != n:
+            self._batch_size = n
+            self._activations = [np.empty((n, size), dtype=self.dtype) for size in self.layer_sizes[1:]]
+            self._deltas = [np.empty((n, size), dtype=self.dtype) for size in self.layer_sizes[1:]]
+        return self._activations, self._deltas
+
+    def forward(self, X):
+        """
+        Run a batch X of shape (n_samples, n_inputs) through the network.
+
+        Returns the output layer, shape (n_samples, n_outputs). The returned
+        array is an internal buffer, overwritten by the next forward call.
+        """
+        X = np.ascontiguousarray(X, dtype=self.dtype)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+
+        activations, _ = self._buffers(X.shape[0])
+
+        inputs = X
+        for W, b, out in zip(self.weights, self.biases, activations):
+            np.matmul(inputs, W, out=out)   # net = inputs . W + b
+            out += b
+            sigmoid(out, out=out)           # out = sigmoid(net)
+            inputs = out
+
+        self._inputs = X
+        return activations[-1]
+
+    def backward(self, Y):
+        """
+        Backpropagate the error of the last forward pass and update
+        every weight and bias. Returns the error before the update.
+        """
+        activations, deltas = self._buffers(self._inputs.shape[0])
+        n = self._inputs.shape[0]
+
+        out = activations[-1]
+        delta = deltas[-1]
+
+        # delta_o = -(target - out) * out * (1 - out)
+        np.subtract(out, Y, out=delta)
+        loss = 0.5 * np.einsum("ij,ij->", delta, delta) / n
+        delta *= out
+        delta *= 1 - out
+
+        for layer in range(len(self.weights) - 1, -1, -1):
+
+            inputs = activations[layer - 1] if layer > 0 else self._inputs
+            W = self.weights[layer]
+
+            # The error of the layer below uses the weights before this update
+            if layer > 0:
+                below = deltas[layer - 1]
+                np.matmul(delta, W.T, out=below)
+                below *= inputs
+                below *= 1 - inputs
+
+            # dE/dW = inputs^T . delta, dE/db = sum(delta), averaged over the batch
+            W -= (self.lr / n) * (inputs.T @ delta)
+            self.biases[layer] -= (self.lr / n) * delta.sum(axis=0)
+
+            if layer > 0:
+                delta = deltas[layer - 1]
+
+        return loss
+
+    def train_step(self, X, Y):
+        """
+        One forward and backward pass on a batch. Returns the batch error.
+        """
+        Y = np.asarray(Y, dtype=self.dtype).reshape(-1, self.layer_sizes[-1])
+        self.forward(X)
+        return self.backward(Y)
+
+    def fit(self, X, Y, epochs=1, batch_size=None, shuffle=True, seed=None):
+        """
+        Train for `epochs` passes over (X, Y).
+
+        batch_size=None trains on the full batch (like BP.py), otherwise on
+        mini-batches of batch_size rows, reshuffled every epoch when shuffle
+        is True. The mean error of every epoch is appended to loss_history.
+        """
+        X = np.ascontiguousarray(X, dtype=self.dtype)
+        Y = np.ascontiguousarray(Y, dtype=self.dtype)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        Y = Y.reshape(X.shape[0], -1)
+
+        n = X.shape[0]
+        if batch_size is None or batch_size >= n:
+            batch_size = n
+            shuffle = False
+
+        rng = np.random.default_rng(seed)
+
+        for _ in range(epochs):
+            order = rng.permutation(n) if shuffle else None
+            total = 0.0
+
+            for start in range(0, n, batch_size):
+                if order is None:
+                    X_batch, Y_batch = X[start:start + batch_size], Y[start:start + batch_size]
+                else:
+                    rows = order[start:start + batch_size]
+                    X_batch, Y_batch = X[rows], Y[rows]
+                total += self.train_step(X_batch, Y_batch) * X_batch.shape[0]
+
+            self.loss_history.append(float(total / n))
+
+        return self
+
+    def predict(self, X):
+        """
+        Network output for X, shape (n_samples, n_outputs).
+        """
+        return self.forward(X).copy()
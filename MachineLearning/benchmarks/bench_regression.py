@@ -0,0 +1,263 @@
+"""
+bench_regression.py
+
+Micro-benchmarks for the hand-written regression models of
+session1 (LinearRegression_r, RidgeRegression, LassoRegression,
+PolynomialRegression) and session2 (LinearRegressionGD).
+
+For every model and every (n_samples, n_features) size it:
+- generates a synthetic linear dataset with a fixed seed
+- times fit and predict (best and median of several repeats)
+- records the peak memory allocated during fit and predict (tracemalloc)
+
+and writes the results as JSON, so runs before and after a change can be
+compared with --compare. A model that got slower than --threshold
+makes the script exit with status 1.
+
+Examples:
+python bench_regression.py --n 1000 100000 --d 1 10 100 --output results.json
+python bench_regression.py --output new.json --compare results.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "..", "session1", "Task"))
+sys.path.insert(0, os.path.join(HERE, "..", "session2", "assignment", "code"))
+
+from Model.LinearRegression import LinearRegression_r
+from Model.Ridge import RidgeRegression
+from Model.Lasso import LassoRegression
+from Preprocessing.Polynomial import PolynomialRegression
+from ClassLinear import LinearRegressionGD
+
+
+def make_data(n_samples, n_features, seed=0):
+    """
+    Generate a synthetic regression dataset y = Xw + b + noise.
+
+    Returns:
+    tuple: (X, y) with X of shape (n_samples, n_features)
+    """
+
+    rng = np.random.default_rng(seed)
+
+    X = rng.standard_normal((n_samples, n_features))
+    y = X @ rng.standard_normal(n_features) + 3.0 + 0.1 * rng.standard_normal(n_samples)
+
+    return X, y
+
+
+# Every entry builds a fresh model, trains it and predicts with it.
+# The learning rates are small enough to stay stable on standardized data.
+MODELS = {
+    "LinearRegression_r": (
+        lambda it: LinearRegression_r(alpha=0.01, iteration=it),
+        lambda model, X, y: model.fit_r(X, y),
+    ),
+    "RidgeRegression": (
+        lambda it: RidgeRegression(alpha=0.01, iteration=it, lambda_=0.1),
+        lambda model, X, y: model.fit(X, y),
+    ),
+    "LassoRegression": (
+        lambda it: LassoRegression(alpha=0.01, iteration=it, lambda_=0.1),
+        lambda model, X, y: model.fit(X, y),
+    ),
+    "PolynomialRegression": (
+        lambda it: PolynomialRegression(degree=2, alpha=0.001, iterations=it, cache=False),
+        lambda model, X, y: model.fit(X, y),
+    ),
+    "LinearRegressionGD": (
+        lambda it: LinearRegressionGD(learning_rate=0.01, n_iters=it),
+        lambda model, X, y: model.fit(X, y),
+    ),
+}
+
+
+def measure(func):
+    """
+    Run func once and return (seconds, peak bytes allocated while it ran).
+
+    Progress printed by the models is swallowed so it does not distort the timing.
+    """
+
+    tracemalloc.start()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        func()
+        seconds = time.perf_counter() - start
+
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return seconds, peak
+
+
+def bench_model(name, X, y, iteration, repeat):
+    """
+    Benchmark fit and predict of one model on one dataset.
+
+    Timings are taken without tracemalloc, which slows numpy calls down,
+    and the peak memory is measured in one extra, separate run.
+
+    Returns:
+    dict: One result row
+    """
+
+    build, fit = MODELS[name]
+
+    # predict gets a different array than fit, so no model can serve it
+    # from a cached transform of the training data
+    X_new = X.copy()
+
+    fit_times = []
+    predict_times = []
+
+    for _ in range(repeat):
+
+        model = build(iteration)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            fit(model, X, y)
+            fit_times.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            model.predict(X_new)
+            predict_times.append(time.perf_counter() - start)
+
+    model = build(iteration)
+    _, fit_peak = measure(lambda: fit(model, X, y))
+    _, predict_peak = measure(lambda: model.predict(X_new))
+
+    return {
+        "model": name,
+        "n_samples": X.shape[0],
+        "n_features": X.shape[1],
+        "iteration": iteration,
+        "fit_best_s": min(fit_times),
+        "fit_median_s": statistics.median(fit_times),
+        "predict_best_s": min(predict_times),
+        "predict_median_s": statistics.median(predict_times),
+        "fit_peak_bytes": fit_peak,
+        "predict_peak_bytes": predict_peak,
+    }
+
+
+def run(sizes_n, sizes_d, models, iteration, repeat, seed=0):
+    """
+    Benchmark every model on every (n, d) combination.
+
+    Returns:
+    dict: JSON-serializable report with metadata and result rows
+    """
+
+    results = []
+
+    for n_samples in sizes_n:
+        for n_features in sizes_d:
+
+            X, y = make_data(n_samples, n_features, seed)
+
+            for name in models:
+                row = bench_model(name, X, y, iteration, repeat)
+                results.append(row)
+
+                print(
+                    f"{name:>22} n={n_samples:<8} d={n_features:<5} "
+                    f"fit={row['fit_best_s'] * 1e3:9.2f} ms  "
+                    f"predict={row['predict_best_s'] * 1e3:8.3f} ms  "
+                    f"peak={row['fit_peak_bytes'] / 2 ** 20:8.2f} MiB",
+                    file=sys.stderr,
+                )
+
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "iteration": iteration,
+            "repeat": repeat,
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+def compare(report, baseline, threshold):
+    """
+    Compare fit times with a baseline report.
+
+    Returns:
+    list: Result rows that are slower than threshold times the baseline
+    """
+
+    key = lambda row: (row["model"], row["n_samples"], row["n_features"], row["iteration"])
+    old = {key(row): row for row in baseline["results"]}
+
+    regressions = []
+
+    for row in report["results"]:
+
+        if key(row) not in old:
+            continue
+
+        ratio = row["fit_best_s"] / old[key(row)]["fit_best_s"]
+        print(f"{row['model']:>22} n={row['n_samples']:<8} d={row['n_features']:<5} fit x{ratio:.2f}", file=sys.stderr)
+
+        if ratio > threshold:
+            regressions.append(row)
+
+    return regressions
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Benchmark the session1/session2 regression models.")
+    parser.add_argument("--n", type=int, nargs="+", default=[1000, 100000], help="numbers of samples")
+    parser.add_argument("--d", type=int, nargs="+", default=[1, 10, 100], help="numbers of features")
+    parser.add_argument("--models", nargs="+", default=list(MODELS), choices=list(MODELS))
+    parser.add_argument("--iteration", type=int, default=100, help="gradient descent iterations per fit")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per measurement")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    parser.add_argument("--compare", help="baseline JSON report to compare against")
+    parser.add_argument("--threshold", type=float, default=1.2, help="slowdown ratio counted as a regression")
+    args = parser.parse_args(argv)
+
+    report = run(args.n, args.d, args.models, args.iteration, args.repeat, args.seed)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.compare:
+
+        with open(args.compare) as file:
+            baseline = json.load(file)
+
+        if compare(report, baseline, args.threshold):
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,6 @@
+import inspect
+import json
+
 import numpy as np
 
 """
@@ -7,18 +10,44 @@ This class represents the base model for all linear-based regression algorithms.
 It contains the common attributes and methods shared between Linear, Ridge, and Lasso regression.
 
 The model follows the equation:
-y = wX + b
+y = Xw + b
 
 where:
-w = weight (slope)
+X = input matrix of shape (n_samples, n_features)
+w = weight vector of shape (n_features,)
 b = bias (intercept)
 
-Other regression models can inherit from this class to reuse the predict function
-and basic parameter initialization.
+A 1-D input X is treated as a single feature, so the old single-slope
+model y = wX + b is just the special case n_features = 1.
+
+Other regression models can inherit from this class to reuse the predict function,
+basic parameter initialization, the vectorized gradient helpers and the
+closed-form solvers.
+
+Trained models can be stored with save() and restored with load().
+The file is an uncompressed .npz with the parameters as plain arrays and
+the constructor arguments as a JSON string, so loading needs no pickle.
 """
 class BaseLinearModel:
-    
-    def __init__(self, alpha: float, iteration: int, lambda_: int):
+
+    # Solvers that compute the exact least-squares / ridge solution in one pass
+    CLOSED_FORM_SOLVERS = ("normal", "cholesky", "qr", "svd")
+
+    # Update rules available to the gradient descent loop
+    OPTIMIZERS = ("gd", "momentum", "nesterov", "adam", "line_search")
+
+    # Optimizer constants
+    MOMENTUM = 0.9
+    ADAM_BETAS = (0.9, 0.999)
+    ADAM_EPS = 1e-8
+    MAX_BACKTRACKS = 50
+
+    # Version of the save() file layout, stored in every file
+    FORMAT_VERSION = 1
+
+    def __init__(self, alpha: float, iteration: int, lambda_: int, solver: str = "gd",
+                 optimizer: str = "gd", tol: float = None, grad_tol: float = None,
+                 record_every: int = 1):
         """
         Initialize the model parameters.
 
@@ -26,31 +55,548 @@ class BaseLinearModel:
         alpha (float): Learning rate used in gradient descent to control update size
         iteration (int): Number of iterations for training the model
         lambda_ (int): Regularization parameter used in Ridge and Lasso regression
-        
+        solver (str): "gd" for gradient descent (default) or, where the model
+            supports it, one of CLOSED_FORM_SOLVERS
+        optimizer (str): Update rule of gradient descent, one of OPTIMIZERS.
+            "line_search" uses alpha as the first trial step of a backtracking search
+        tol (float): Stop when the relative change of the loss falls below tol (None = never)
+        grad_tol (float): Stop when the gradient norm falls below grad_tol (None = never)
+        record_every (int): Record the loss only every record_every gradient descent iterations
+
         Attributes:
-        w (float): Weight parameter initialized later during training
+        w (float or numpy array): Weight parameter(s) initialized later during training
         b (float): Bias parameter initialized later during training
-        loss_history (list): Stores loss values at each iteration to track training performance
+        loss_history (numpy array): Loss values recorded during training, a view of a
+            preallocated buffer that grows across fits
+        n_iter (int): Number of gradient descent iterations actually run by the last fit
         """
-        
+
         self.alpha = alpha
-    
+
         self.iteration = iteration
-        
+
         self.lambda_ = lambda_
-        
+
+        self.solver = solver
+
+        self.optimizer = optimizer
+        self.tol = tol
+        self.grad_tol = grad_tol
+        self.record_every = record_every
+
         self.w = 0
         self.b = 0
-        
-        self.loss_history = []
-        
-    
+
+        self._history = np.empty(0)
+        self._n_recorded = 0
+
+        self.n_iter = 0
+
+
+    @property
+    def loss_history(self):
+        """
+        Recorded loss values, in training order.
+        """
+
+        return self._history[:self._n_recorded]
+
+
+    def _reserve_history(self, extra):
+        """
+        Make room for `extra` more loss values in the history buffer.
+
+        The buffer at least doubles when it grows, so appending stays cheap,
+        and gradient descent reserves its whole run up front.
+        """
+
+        needed = self._n_recorded + extra
+
+        if needed > self._history.shape[0]:
+            grown = np.empty(max(needed, 2 * self._history.shape[0]))
+            grown[:self._n_recorded] = self._history[:self._n_recorded]
+            self._history = grown
+
+
+    def _append_loss(self, loss):
+        """
+        Store one loss value in the history buffer.
+        """
+
+        self._reserve_history(1)
+
+        self._history[self._n_recorded] = loss
+        self._n_recorded += 1
+
+
+    def _as_matrix(self, X):
+        """
+        Convert the input into a float matrix of shape (n_samples, n_features).
+
+        A 1-D array (or a scalar) is treated as one feature column.
+        Sparse matrices (scipy.sparse) are passed through unchanged.
+        """
+
+        if hasattr(X, "tocsr"):
+            return X
+
+        X = np.asarray(X, dtype=float)
+
+        if X.ndim < 2:
+            X = X.reshape(-1, 1)
+
+        return X
+
+
+    def _init_params(self, X):
+        """
+        Create the weight vector and the gradient buffers for training on X.
+
+        The buffers are allocated once here and reused by every gradient
+        descent step, so the training loop does not allocate new arrays.
+
+        Parameters:
+        X (numpy array): Training matrix of shape (n_samples, n_features)
+        """
+
+        n_samples, n_features = X.shape
+
+        self.w = np.zeros(n_features)
+        self.b = 0.0
+
+        self._residual = np.empty(n_samples)
+        self._grad_w = np.empty(n_features)
+        self._step_w = np.empty(n_features)
+
+
+    @staticmethod
+    def _matvec(X, w, out):
+        """
+        Write X @ w into out, without a temporary for dense X.
+        """
+
+        if isinstance(X, np.ndarray):
+            np.dot(X, w, out=out)
+        else:
+            out[:] = X @ w
+
+
+    def _gradients(self, X, y):
+        """
+        Compute the residual and the SSE gradients with one matmul per pass.
+
+        After this call:
+        self._residual[:n] holds (Xw + b - y)
+        self._grad_w holds (2/n) * X^T (Xw + b - y)
+
+        Parameters:
+        X (numpy array): Training matrix of shape (n_samples, n_features)
+        y (numpy array): True target values of shape (n_samples,)
+
+        Returns:
+        float: Gradient of the SSE term with respect to the bias
+        """
+
+        n = X.shape[0]
+        r = self._residual[:n]
+        self._n_rows = n
+
+        self._matvec(X, self.w, r)
+        r += self.b
+        r -= y
+
+        if isinstance(X, np.ndarray):
+            np.dot(r, X, out=self._grad_w)
+        else:
+            self._grad_w[:] = X.T @ r
+        self._grad_w *= 2 / n
+
+        return (2 / n) * r.sum()
+
+
+    def _sse(self):
+        """
+        Return the sum of squared errors of the last computed residual.
+        """
+
+        r = self._residual[:self._n_rows]
+
+        return np.dot(r, r)
+
+
+    def _penalty_gradient(self):
+        """
+        Return the gradient of the regularization term with respect to w.
+
+        Plain least squares has no penalty. Ridge and Lasso override this.
+        """
+
+        return 0.0
+
+
+    def _penalty(self):
+        """
+        Return the value of the regularization term added to the SSE loss.
+        """
+
+        return 0.0
+
+
+    def _record_loss(self, i, sse, loss):
+        """
+        Store the loss of iteration i. Subclasses can extend this to log more.
+        """
+
+        self._append_loss(loss)
+
+
+    def _converged(self, prev_loss, loss, D_w, D_b):
+        """
+        Check the tol / grad_tol stopping rules after one iteration.
+        """
+
+        if self.grad_tol is not None:
+            if np.sqrt(np.dot(D_w, D_w) + D_b * D_b) <= self.grad_tol:
+                return True
+
+        if self.tol is not None and prev_loss is not None:
+            if abs(prev_loss - loss) <= self.tol * max(abs(prev_loss), np.finfo(float).tiny):
+                return True
+
+        return False
+
+
+    def _gradient_descent(self, X, y):
+        """
+        Run the gradient descent loop shared by all models.
+
+        Every iteration computes the SSE gradient plus the model's penalty
+        gradient and applies the update rule chosen by self.optimizer:
+
+        gd          -> w -= alpha * g
+        momentum    -> v = MOMENTUM * v - alpha * g,  w += v
+        nesterov    -> like momentum, but g is taken at the look-ahead point w + MOMENTUM * v
+        adam        -> bias-corrected first/second moment estimates scale every coordinate
+        line_search -> backtracking (Armijo) search along -g, starting from twice the last accepted step
+
+        The loop stops after self.iteration steps, or earlier when tol or grad_tol is met.
+
+        The loss is only computed when it is recorded (every record_every
+        iterations) or needed by tol / line search, and the history buffer
+        is reserved before the loop, so tracking it allocates nothing per step.
+
+        Parameters:
+        X (numpy array): Training matrix of shape (n_samples, n_features)
+        y (numpy array): True target values of shape (n_samples,)
+        """
+
+        if self.optimizer not in self.OPTIMIZERS:
+            raise ValueError(
+                f"Unknown optimizer '{self.optimizer}'. "
+                f"Choose one of: {', '.join(self.OPTIMIZERS)}"
+            )
+
+        self._init_params(X)
+
+        beta = self.MOMENTUM
+        beta1, beta2 = self.ADAM_BETAS
+
+        # Velocity (momentum / nesterov) or first moment (adam)
+        v_w = np.zeros_like(self.w)
+        v_b = 0.0
+
+        # Second moment (adam)
+        s_w = np.zeros_like(self.w)
+        s_b = 0.0
+
+        step = self.alpha / 2
+        accepted = True
+        prev_loss = None
+        loss = None
+
+        if self.optimizer == "line_search":
+            self._trial_residual = np.empty(X.shape[0])
+
+        self._reserve_history(self.iteration // self.record_every + 1)
+
+        self.n_iter = 0
+
+        for i in range(self.iteration):
+
+            if self.optimizer == "nesterov":
+                self.w += beta * v_w
+                self.b += beta * v_b
+
+            D_b = self._gradients(X, y)
+
+            D_w = self._grad_w
+            D_w += self._penalty_gradient()
+
+            if self.optimizer == "nesterov":
+                self.w -= beta * v_w
+                self.b -= beta * v_b
+
+            record = i % self.record_every == 0
+            need_loss = record or self.tol is not None or self.optimizer == "line_search"
+
+            if need_loss:
+                sse = self._sse()
+
+            if self.optimizer == "gd":
+
+                np.multiply(D_w, self.alpha, out=self._step_w)
+                self.w -= self._step_w
+                self.b -= self.alpha * D_b
+
+            elif self.optimizer in ("momentum", "nesterov"):
+
+                v_w *= beta
+                v_w -= self.alpha * D_w
+                v_b = beta * v_b - self.alpha * D_b
+
+                self.w += v_w
+                self.b += v_b
+
+            elif self.optimizer == "adam":
+
+                t = i + 1
+
+                v_w *= beta1
+                v_w += (1 - beta1) * D_w
+                v_b = beta1 * v_b + (1 - beta1) * D_b
+
+                s_w *= beta2
+                s_w += (1 - beta2) * D_w ** 2
+                s_b = beta2 * s_b + (1 - beta2) * D_b ** 2
+
+                m_scale = 1 / (1 - beta1 ** t)
+                s_scale = 1 / (1 - beta2 ** t)
+
+                self.w -= self.alpha * (v_w * m_scale) / (np.sqrt(s_w * s_scale) + self.ADAM_EPS)
+                self.b -= self.alpha * (v_b * m_scale) / (np.sqrt(s_b * s_scale) + self.ADAM_EPS)
+
+            else:
+
+                step, accepted = self._backtracking_step(X, y, D_w, D_b, sse, 2 * step)
+
+            if need_loss:
+                loss = sse + self._penalty()
+
+            if record:
+                self._record_loss(i, sse, loss)
+
+            self.n_iter = i + 1
+
+            # A failed line search barely moves w, which is no sign of convergence
+            if self._converged(prev_loss if accepted else None, loss, D_w, D_b):
+                break
+
+            prev_loss = loss
+
+
+    def _backtracking_step(self, X, y, D_w, D_b, sse, step):
+        """
+        Take one gradient step whose size is found by backtracking line search.
+
+        The step is halved until the objective (1/n) * SSE + penalty decreases
+        by at least half of what the linear model of the gradient predicts
+        (Armijo condition), so a too large alpha can not make the loop diverge.
+
+        Returns:
+        tuple: (step, accepted), the last step tried and whether it met the
+            Armijo condition within MAX_BACKTRACKS halvings
+        """
+
+        n = X.shape[0]
+
+        f0 = sse / n + self._penalty()
+        g2 = np.dot(D_w, D_w) + D_b * D_b
+
+        w0 = self.w.copy()
+        b0 = self.b
+
+        r = self._trial_residual
+
+        for _ in range(self.MAX_BACKTRACKS):
+
+            np.multiply(D_w, step, out=self._step_w)
+            np.subtract(w0, self._step_w, out=self.w)
+            self.b = b0 - step * D_b
+
+            self._matvec(X, self.w, r)
+            r += self.b
+            r -= y
+
+            if np.dot(r, r) / n + self._penalty() <= f0 - 0.5 * step * g2:
+                return step, True
+
+            step *= 0.5
+
+        return step * 2, False
+
+
+    def partial_fit(self, X_batch, y_batch):
+        """
+        Perform one gradient descent step on a single batch of data.
+
+        The first call (or a call with a different number of features)
+        initializes the weights, later calls continue from the current
+        weights. Only the batch has to be in memory, so calling this on
+        consecutive chunks trains on datasets larger than RAM.
+
+        Parameters:
+        X_batch (array-like): Batch features, shape (batch_size,) or (batch_size, n_features)
+        y_batch (array-like): Batch target values
+        """
+
+        X = self._as_matrix(X_batch)
+        y = np.asarray(y_batch, dtype=float).reshape(-1)
+
+        n_samples, n_features = X.shape
+
+        if not isinstance(self.w, np.ndarray) or self.w.shape != (n_features,):
+            self._init_params(X)
+
+        # Weights from a closed-form / "cd" fit or from load() come without
+        # the gradient buffers; allocate them and keep w and b
+        elif getattr(self, "_grad_w", None) is None or self._grad_w.shape != (n_features,):
+            self._residual = np.empty(n_samples)
+            self._grad_w = np.empty(n_features)
+            self._step_w = np.empty(n_features)
+
+        elif self._residual.shape[0] < n_samples:
+            self._residual = np.empty(n_samples)
+
+        D_b = self._gradients(X, y)
+
+        sse = self._sse()
+
+        D_w = self._grad_w
+        D_w += self._penalty_gradient()
+
+        self.w -= self.alpha * D_w
+        self.b -= self.alpha * D_b
+
+        self._append_loss(sse + self._penalty())
+
+
+    def fit_batches(self, batches, epochs: int = 1):
+        """
+        Train with mini-batch gradient descent over a stream of chunks.
+
+        Parameters:
+        batches (iterable or callable): Yields (X_batch, y_batch) tuples.
+            For more than one epoch pass a function that returns a new
+            iterator every time, e.g. lambda: iter_batches(X, y, 256)
+        epochs (int): Number of passes over the stream
+        """
+
+        if epochs > 1 and not callable(batches):
+            raise ValueError("fit_batches with epochs > 1 needs a callable that returns "
+                             "a new iterator of batches for every epoch.")
+
+        for epoch in range(epochs):
+
+            stream = batches() if callable(batches) else batches
+
+            for X_batch, y_batch in stream:
+                self.partial_fit(X_batch, y_batch)
+
+
+    def _check_solver(self, supported):
+        """
+        Raise a ValueError if self.solver is not one of the supported solvers.
+        """
+
+        if self.solver not in supported:
+            raise ValueError(
+                f"Unknown solver '{self.solver}' for {type(self).__name__}. "
+                f"Choose one of: {', '.join(supported)}"
+            )
+
+
+    def _solve_closed_form(self, X, y, lambda_=0.0):
+        """
+        Compute the exact minimizer of (1/n) * SSE + lambda_ * ||w||^2.
+
+        This is the same objective the gradient descent loops minimize,
+        so both paths reach the same weights. The bias is not penalized,
+        which is handled by centering X and y before solving for w.
+
+        Solvers:
+        normal   -> solve (Xc^T Xc + n*lambda_*I) w = Xc^T yc
+        cholesky -> same system, factorized as L L^T (needs a positive definite matrix)
+        qr       -> least squares on [Xc; sqrt(n*lambda_) I] via QR, avoids squaring the condition number
+                    (minimum-norm solution when X has fewer rows than columns or is rank-deficient)
+        svd      -> w = V diag(s / (s^2 + n*lambda_)) U^T yc, the most robust for ill-conditioned data
+
+        Parameters:
+        X (numpy array): Training matrix of shape (n_samples, n_features)
+        y (numpy array): True target values of shape (n_samples,)
+        lambda_ (float): L2 penalty, 0 for plain least squares
+
+        Returns:
+        tuple: (w, b)
+        """
+
+        n_samples, n_features = X.shape
+        penalty = n_samples * lambda_
+
+        x_mean = X.mean(axis=0)
+        y_mean = y.mean()
+
+        Xc = X - x_mean
+        yc = y - y_mean
+
+        if self.solver in ("normal", "cholesky"):
+
+            A = Xc.T @ Xc
+            A.flat[::n_features + 1] += penalty
+            rhs = Xc.T @ yc
+
+            if self.solver == "normal":
+                w = np.linalg.solve(A, rhs)
+            else:
+                L = np.linalg.cholesky(A)
+                w = np.linalg.solve(L.T, np.linalg.solve(L, rhs))
+
+        elif self.solver == "qr":
+
+            if penalty > 0:
+                Xc = np.vstack((Xc, np.sqrt(penalty) * np.eye(n_features)))
+                yc = np.concatenate((yc, np.zeros(n_features)))
+
+            Q, R = np.linalg.qr(Xc)
+
+            # R is not square for n_samples < n_features and singular for
+            # rank-deficient X; lstsq then returns the minimum-norm solution
+            w = np.linalg.lstsq(R, Q.T @ yc, rcond=None)[0]
+
+        else:
+
+            U, sigma, Vt = np.linalg.svd(Xc, full_matrices=False)
+
+            # Drop singular values at round-off level, like a pseudo-inverse
+            keep = sigma > sigma[0] * max(n_samples, n_features) * np.finfo(float).eps
+            shrink = np.zeros_like(sigma)
+            shrink[keep] = sigma[keep] / (sigma[keep] ** 2 + penalty)
+
+            w = Vt.T @ (shrink * (U.T @ yc))
+
+        b = y_mean - np.dot(x_mean, w)
+
+        return w, b
+
+
     def predict(self, X):
         """
         Predict the output using the current model parameters.
 
         This function applies the linear equation:
-        y = wX + b
+        y = Xw + b
+
+        For a single-feature model a scalar or 1-D input is treated as
+        feature values and the output keeps the same shape as X.
 
         Parameters:
         X (array-like): Input feature values
@@ -58,5 +604,92 @@ class BaseLinearModel:
         Returns:
         array-like: Predicted output values
         """
-        
-        return self.w * X + self.b
+
+        X = np.asarray(X, dtype=float)
+        w = np.atleast_1d(self.w)
+
+        if X.ndim < 2 and w.size == 1:
+            return w[0] * X + self.b
+
+        return np.dot(X, w) + self.b
+
+
+    def _init_args(self):
+        """
+        Constructor arguments that rebuild this model, read from the
+        attributes with the same names as the __init__ parameters.
+        """
+
+        parameters = inspect.signature(type(self).__init__).parameters
+
+        return {name: getattr(self, name) for name in parameters if name != "self"}
+
+
+    def _state(self):
+        """
+        Arrays stored by save(). None values are skipped.
+        """
+
+        return {"w": self.w, "b": self.b}
+
+
+    def _load_state(self, state):
+        """
+        Restore the arrays written by save().
+        """
+
+        w = state["w"]
+
+        self.w = w.item() if w.ndim == 0 else w
+        self.b = state["b"].item()
+
+
+    def save(self, path):
+        """
+        Save the trained parameters and the constructor arguments.
+
+        Parameters:
+        path (str): Target file, ".npz" is appended when missing
+
+        The loss history is not stored.
+        """
+
+        arrays = {name: np.asarray(value) for name, value in self._state().items() if value is not None}
+
+        # numpy scalars/arrays in the arguments are stored as plain JSON numbers/lists
+        init_args = json.dumps(self._init_args(), default=lambda value: np.asarray(value).tolist())
+
+        np.savez(path, format_version=np.array(self.FORMAT_VERSION), model=np.array(type(self).__name__),
+                 init_args=np.array(init_args), **arrays)
+
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load a model written by save() of the same class.
+
+        Parameters:
+        path (str): File written by save()
+
+        Returns:
+        The restored model, ready to predict
+        """
+
+        with np.load(path) as data:
+
+            version = int(data["format_version"])
+            name = str(data["model"])
+
+            if version > cls.FORMAT_VERSION:
+                raise ValueError(f"{path} has format version {version}, "
+                                 f"this code reads up to {cls.FORMAT_VERSION}")
+
+            if name != cls.__name__:
+                raise ValueError(f"{path} holds a {name}, not a {cls.__name__}")
+
+            model = cls(**json.loads(str(data["init_args"])))
+
+            meta = ("format_version", "model", "init_args")
+            model._load_state({key: data[key] for key in data.files if key not in meta})
+
+        return model
@@ -0,0 +1,237 @@
+import numpy as np
+from Model.BaseLinear import BaseLinearModel
+from Model.Ridge import RidgeRegression
+from Model.Lasso import LassoRegression
+
+"""
+BatchedRegression class
+
+This class trains many Ridge or Lasso models on the same data at once,
+one for every (lambda_, alpha) pair of a hyperparameter grid.
+
+The K weight vectors are stacked into a (K, n_features) matrix W.
+The SSE gradient of all K models is (2/n) (X W^T + b - y)^T X, which only
+depends on the data through X^T X, X^T y and the column sums. These are
+computed once, so one gradient descent step for all K configurations is
+a single matmul whose cost does not depend on n_samples:
+
+G = (2/n) (W X^T X + b x_sum^T - X^T y) + penalty   (K, n_features)
+
+When there are more features than samples the residual form
+R = X W^T + b - y is cheaper and used instead.
+
+Every configuration follows exactly the same updates as a separate
+RidgeRegression / LassoRegression with solver="gd", optimizer="gd",
+so a 100-point lambda sweep costs about as much as one single fit.
+"""
+class BatchedRegression(BaseLinearModel):
+
+    PENALTIES = ("ridge", "lasso")
+
+    def __init__(self, lambdas, alphas, iteration: int, penalty: str = "ridge"):
+        """
+        Initialize the grid of models.
+
+        Parameters:
+        lambdas (float or array-like): Regularization values to try
+        alphas (float or array-like): Learning rates to try
+        iteration (int): Number of gradient descent iterations for every model
+        penalty (str): "ridge" (L2) or "lasso" (L1)
+
+        Every lambda is combined with every alpha, giving
+        K = len(lambdas) * len(alphas) models.
+
+        Attributes:
+        lambda_grid (numpy array): lambda_ of every model, shape (K,)
+        alpha_grid (numpy array): alpha of every model, shape (K,)
+        W (numpy array): Weights of every model, shape (K, n_features)
+        B (numpy array): Bias of every model, shape (K,)
+        loss_grid (numpy array): Loss of every model at every iteration, shape (iteration, K)
+        """
+
+        if penalty not in self.PENALTIES:
+            raise ValueError(f"Unknown penalty '{penalty}'. Choose one of: {', '.join(self.PENALTIES)}")
+
+        lambda_mesh, alpha_mesh = np.meshgrid(
+            np.atleast_1d(np.asarray(lambdas, dtype=float)),
+            np.atleast_1d(np.asarray(alphas, dtype=float)),
+            indexing="ij"
+        )
+
+        super().__init__(alpha=alpha_mesh.ravel(), iteration=iteration, lambda_=lambda_mesh.ravel())
+
+        self.penalty = penalty
+
+        self.lambda_grid = self.lambda_
+        self.alpha_grid = self.alpha
+
+        # The grid axes, kept so save() can rebuild the model
+        self.lambdas = lambda_mesh[:, 0]
+        self.alphas = alpha_mesh[0]
+
+        self.W = None
+        self.B = None
+
+        self.loss_grid = None
+
+
+    def fit(self, X, y):
+        """
+        Train all K models with gradient descent at the same time.
+
+        Parameters:
+        X (array-like): Input features, shape (n_samples,) or (n_samples, n_features)
+        y (array-like): True target values
+
+        Returns:
+        numpy array: The loss history of every model, shape (iteration, K)
+        """
+
+        X = self._as_matrix(X)
+        y = np.asarray(y, dtype=float).reshape(-1)
+
+        n_samples, n_features = X.shape
+        n_models = self.lambda_grid.shape[0]
+
+        W = np.zeros((n_models, n_features))
+        B = np.zeros(n_models)
+
+        # Buffers reused by every step
+        G = np.empty((n_models, n_features))
+        D_b = np.empty(n_models)
+        sse = np.empty(n_models)
+
+        lambdas = self.lambda_grid[:, None]
+        alphas = self.alpha_grid[:, None]
+
+        use_gram = n_features <= n_samples
+
+        if use_gram:
+            gram = X.T @ X
+            Xty = X.T @ y
+            x_sum = X.sum(axis=0)
+            y_sum = y.sum()
+            yty = np.dot(y, y)
+            Wx = np.empty(n_models)
+        else:
+            R = np.empty((n_samples, n_models))
+
+        self.loss_grid = np.empty((self.iteration, n_models))
+
+        for i in range(self.iteration):
+
+            if use_gram:
+
+                # G = R^T X and D_b = sum(R) without forming R
+                np.dot(W, gram, out=G)
+                G += B[:, None] * x_sum
+                G -= Xty
+
+                np.dot(W, x_sum, out=Wx)
+                np.multiply(B, n_samples, out=D_b)
+                D_b += Wx
+                D_b -= y_sum
+
+                # SSE = w.G + b*(w.x_sum) + n*b² - w.Xty - 2*b*y_sum + y.y
+                np.einsum("ij,ij->i", W, G, out=sse)
+                sse += B * (Wx + n_samples * B - 2 * y_sum) - W @ Xty + yty
+
+            else:
+
+                np.dot(X, W.T, out=R)
+                R += B
+                R -= y[:, None]
+
+                np.dot(R.T, X, out=G)
+                np.sum(R, axis=0, out=D_b)
+                np.einsum("ij,ij->j", R, R, out=sse)
+
+            G *= 2 / n_samples
+            D_b *= 2 / n_samples
+
+            if self.penalty == "ridge":
+                G += 2 * lambdas * W
+            else:
+                G += lambdas * np.sign(W)
+
+            G *= alphas
+            W -= G
+            B -= self.alpha_grid * D_b
+
+            if self.penalty == "ridge":
+                self.loss_grid[i] = sse + self.lambda_grid * np.einsum("ij,ij->i", W, W)
+            else:
+                self.loss_grid[i] = sse + self.lambda_grid * np.abs(W).sum(axis=1)
+
+        self.W = W
+        self.B = B
+
+        return self.loss_grid
+
+
+    def predict(self, X):
+        """
+        Predict with every model of the grid.
+
+        Parameters:
+        X (array-like): Input features, shape (n_samples,) or (n_samples, n_features)
+
+        Returns:
+        numpy array: Predictions of shape (n_samples, K)
+        """
+
+        return np.dot(self._as_matrix(X), self.W.T) + self.B
+
+
+    def best(self, X_val, y_val):
+        """
+        Return the index of the model with the lowest validation MSE, and the MSE of every model.
+        """
+
+        residual = self.predict(X_val) - np.asarray(y_val, dtype=float).reshape(-1, 1)
+        mse = np.mean(residual ** 2, axis=0)
+
+        return int(np.argmin(mse)), mse
+
+
+    def _state(self):
+        """
+        Arrays stored by save().
+        """
+
+        return {"W": self.W, "B": self.B}
+
+
+    def _load_state(self, state):
+        """
+        Restore the arrays written by save().
+        """
+
+        self.W = state.get("W")
+        self.B = state.get("B")
+
+
+    def to_models(self):
+        """
+        Split the grid into separate RidgeRegression / LassoRegression objects.
+
+        Returns:
+        list: One trained model per configuration, with w, b and loss_history filled in
+        """
+
+        model_class = RidgeRegression if self.penalty == "ridge" else LassoRegression
+        models = []
+
+        for k in range(self.W.shape[0]):
+
+            model = model_class(alpha=self.alpha_grid[k], iteration=self.iteration, lambda_=self.lambda_grid[k])
+
+            model.w = self.W[k].copy()
+            model.b = self.B[k]
+
+            for loss in self.loss_grid[:, k]:
+                model._append_loss(loss)
+
+            models.append(model)
+
+        return models
@@ -2,7 +2,8 @@ import numpy as np
 from Model.BaseLinear import BaseLinearModel
 
 """
-This class implements Lasso Regression using Gradient Descent.
+This class implements Lasso Regression using Gradient Descent
+or cyclic Coordinate Descent.
 
 Lasso Regression is similar to Linear Regression, but it adds
 an L1 regularization term to the loss function. This helps:
@@ -14,19 +15,47 @@ an L1 regularization term to the loss function. This helps:
 The objective function minimized is:
 
 Loss = Sum of Squared Errors (SSE) + lambda * |w|
+
+With solver="cd" every weight is updated exactly by soft-thresholding,
+so weights of useless features become exactly zero.
 """
 class LassoRegression(BaseLinearModel):
-    
+
+    # Coordinate Descent tolerance used when tol is not given
+    CD_TOL = 1e-6
+
+    def __init__(self, alpha: float, iteration: int, lambda_: int, solver: str = "gd",
+                 optimizer: str = "gd", tol: float = None, grad_tol: float = None,
+                 record_every: int = 1):
+        """
+        Initialize the Lasso Regression model.
+
+        :parameter_solver: "gd" for Gradient Descent (default) or "cd" for Coordinate Descent
+        :parameter_Type_solver: str
+
+        :parameter_tol: Gradient Descent stops when the relative loss change is below tol.
+                        Coordinate Descent stops when no weight changes more than tol (default CD_TOL)
+        :parameter_Type_tol: float
+
+        :parameter_record_every: Gradient Descent records the loss only every record_every iterations
+        :parameter_Type_record_every: int
+        """
+
+        super().__init__(alpha=alpha, iteration=iteration, lambda_=lambda_, solver=solver,
+                         optimizer=optimizer, tol=tol, grad_tol=grad_tol,
+                         record_every=record_every)
+
     def fit(self, X, y):
         """
-        Train the Lasso Regression model using Gradient Descent.
-        
-        :parameter_Type_X :Input feature values
+        Train the Lasso Regression model using Gradient Descent
+        or Coordinate Descent (self.solver == "cd").
+
+        :parameter_Type_X :Input feature values, shape (n_samples,) or (n_samples, n_features)
         :parameter_X : numpy array
-        
+
         :parameter_y: True target values
         :parameter_Type_y : numpy array
-            
+
 
         This function updates:
         - weight (self.w)
@@ -34,21 +63,202 @@ class LassoRegression(BaseLinearModel):
 
         and stores loss values in loss_history.
         """
-        
-       
-        n = len(X)
-        
+
+        self._check_solver(("gd", "cd"))
+
+        # The Armijo test of the line search uses the sign(w) subgradient and
+        # keeps failing at the kinks of |w|, so the step collapses to ~0
+        if self.solver == "gd" and self.optimizer == "line_search":
+            raise ValueError("optimizer='line_search' does not support the L1 penalty of "
+                             "LassoRegression, use solver='cd' or another optimizer")
+
+        X = self._as_matrix(X)
+        y = np.asarray(y, dtype=float).reshape(-1)
+
+        if self.solver == "cd":
+
+            Xc, yc, x_mean, y_mean, col_sq = self._center(X, y)
+
+            w = np.zeros(X.shape[1])
+            self._coordinate_descent(Xc, yc, col_sq, self.lambda_, w, record_loss=True)
+
+            self.w = w
+            self.b = y_mean - np.dot(x_mean, w)
+
+            return
+
+        self._gradient_descent(X, y)
+
+    def lasso_path(self, X, y, lambdas):
+        """
+        Compute the Coordinate Descent solution for every lambda in lambdas.
+
+        The lambdas are solved from the largest to the smallest, and each
+        solve is warm-started from the previous solution. Features are
+        screened with the sequential strong rule, so most coordinates of a
+        sparse solution are never visited. A KKT check afterwards adds back
+        any screened feature that should have been active.
+
+        The model's own w and b are not changed.
+
+        :parameter_X: Input feature values, shape (n_samples,) or (n_samples, n_features)
+        :parameter_y: True target values
+        :parameter_lambdas: Regularization values to solve for
+
+        :return: (weights, biases) with shapes (len(lambdas), n_features) and (len(lambdas),),
+                 in the same order as lambdas
+        """
+
+        X = self._as_matrix(X)
+        y = np.asarray(y, dtype=float).reshape(-1)
+        lambdas = np.asarray(lambdas, dtype=float).reshape(-1)
+
+        Xc, yc, x_mean, y_mean, col_sq = self._center(X, y)
+        n_samples, n_features = X.shape
+
+        weights = np.zeros((len(lambdas), n_features))
+        biases = np.zeros(len(lambdas))
+
+        w = np.zeros(n_features)
+        residual = yc.copy()
+
+        # Smallest lambda that keeps every weight at zero
+        prev_threshold = np.max(np.abs(Xc.T @ yc))
+
+        for k in np.argsort(-lambdas):
+
+            threshold = n_samples * lambdas[k] / 2
+
+            # Sequential strong rule: keep the active weights and the features
+            # whose correlation with the residual is close to the threshold
+            correlation = np.abs(Xc.T @ residual)
+            candidates = np.flatnonzero((correlation >= 2 * threshold - prev_threshold) | (w != 0))
+
+            while True:
+
+                residual = self._coordinate_descent(Xc, yc, col_sq, lambdas[k], w, candidates)
+
+                # KKT check on the screened out features
+                screened = np.setdiff1d(np.arange(n_features), candidates)
+                violations = screened[np.abs(Xc[:, screened].T @ residual) > threshold]
+
+                if violations.size == 0:
+                    break
+
+                candidates = np.union1d(candidates, violations)
+
+            weights[k] = w
+            biases[k] = y_mean - np.dot(x_mean, w)
+
+            prev_threshold = threshold
+
+        return weights, biases
+
+    def _penalty_gradient(self):
+        """
+        Subgradient of the L1 penalty lambda * |w|. We use `np.sign(self.w)` because
+        it represents the derivative of |w|, which pushes weights toward zero.
+
+        partial_fit always takes a gradient step, whatever self.solver is.
+        """
+
+        return self.lambda_ * np.sign(self.w)
+
+    def _penalty(self):
+        """
+        Value of the L1 penalty lambda * |w|.
+        """
+
+        return self.lambda_ * np.sum(np.abs(self.w))
+
+    def _center(self, X, y):
+        """
+        Center X and y so the unpenalized bias drops out of Coordinate Descent.
+
+        Xc is stored column-major, because every coordinate update reads one column.
+        """
+
+        x_mean = X.mean(axis=0)
+        y_mean = y.mean()
+
+        Xc = np.asfortranarray(X - x_mean)
+        yc = y - y_mean
+
+        col_sq = np.einsum("ij,ij->j", Xc, Xc)
+
+        return Xc, yc, x_mean, y_mean, col_sq
+
+    def _coordinate_descent(self, Xc, yc, col_sq, lambda_, w, candidates=None, record_loss=False):
+        """
+        Minimize (1/n) * SSE + lambda_ * |w| over w with cyclic Coordinate Descent.
+
+        Each update solves one coordinate exactly:
+            w_j = S(x_j . r_j, n * lambda_ / 2) / (x_j . x_j)
+        where r_j is the residual without feature j and S is soft-thresholding.
+
+        After a sweep over the candidates the loop only cycles over the
+        active (non-zero) weights until they converge, then sweeps all
+        candidates again. It stops when a full sweep changes nothing,
+        or after self.iteration full sweeps.
+
+        w is updated in place, and the final residual yc - Xc w is returned.
+        """
+
+        n_samples, n_features = Xc.shape
+        threshold = n_samples * lambda_ / 2
+        tol = self.CD_TOL if self.tol is None else self.tol
+
+        if candidates is None:
+            candidates = np.arange(n_features)
+
+        candidates = candidates[col_sq[candidates] > 0]
+
+        residual = yc - Xc @ w
+
         for i in range(self.iteration):
-            
-            y_hat = self.predict(X)
-            
-            D_w = (2/n) * np.sum((y_hat - y) * X) + self.lambda_ * np.sign(self.w)   #We use `np.sign(self.w)` because it represents the derivative of the L1 regularization term ( |w| ), which pushes weights toward zero during gradient descent.
-
-            D_b = (2/n) * np.sum(y_hat - y)
-            
-            self.w -= self.alpha * D_w
-            self.b -= self.alpha * D_b
-            
-            loss = np.sum((y_hat - y)**2) + self.lambda_ * np.abs(self.w)
-        
-            self.loss_history.append(loss)
+
+            max_change = self._cd_sweep(Xc, residual, col_sq, threshold, w, candidates)
+
+            if record_loss:
+                loss = np.dot(residual, residual) + lambda_ * np.sum(np.abs(w))
+                self._append_loss(loss)
+
+            if max_change <= tol * max(1.0, np.max(np.abs(w))):
+                break
+
+            active = candidates[w[candidates] != 0]
+
+            for _ in range(self.iteration):
+
+                change = self._cd_sweep(Xc, residual, col_sq, threshold, w, active)
+
+                if change <= tol * max(1.0, np.max(np.abs(w))):
+                    break
+
+        return residual
+
+    @staticmethod
+    def _cd_sweep(Xc, residual, col_sq, threshold, w, indices):
+        """
+        Update every weight in indices once, keeping residual = yc - Xc w in sync.
+
+        Returns the largest absolute change of a weight.
+        """
+
+        max_change = 0.0
+
+        for j in indices:
+
+            column = Xc[:, j]
+            w_old = w[j]
+
+            rho = np.dot(column, residual) + col_sq[j] * w_old
+
+            w_new = np.sign(rho) * max(abs(rho) - threshold, 0.0) / col_sq[j]   # soft-thresholding
+
+            if w_new != w_old:
+                residual -= (w_new - w_old) * column
+                w[j] = w_new
+                max_change = max(max_change, abs(w_new - w_old))
+
+        return max_change
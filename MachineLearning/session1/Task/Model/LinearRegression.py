@@ -1,6 +1,7 @@
 """
 This class implements Linear Regression using Gradient Descent.
 It inherits from BaseLinearModel and learns the best line by minimizing SSE.
+The exact solution can also be computed in one pass with a closed-form solver.
 """
 
 import numpy as np
@@ -19,56 +20,80 @@ class LinearRegression_r(BaseLinearModel):
     - loss_history storage
     """
 
-    def __init__(self, alpha: float, iteration: int = 20):
+    def __init__(self, alpha: float, iteration: int = 20, solver: str = "gd",
+                 optimizer: str = "gd", tol: float = None, grad_tol: float = None,
+                 record_every: int = 1):
         """
         Initialize Linear Regression model.
 
         Parameters:
         alpha (float): learning rate
-        iteration (int): number of training iterations
+        iteration (int): maximum number of training iterations
+        solver (str): "gd" (default), "normal", "cholesky", "qr" or "svd"
+        optimizer (str): "gd" (default), "momentum", "nesterov", "adam" or "line_search"
+        tol (float): stop when the relative SSE change is below tol
+        grad_tol (float): stop when the gradient norm is below grad_tol
+        record_every (int): record (and print) the SSE only every record_every iterations
         """
 
         
-        super().__init__(alpha=alpha, iteration=iteration, lambda_=0)
+        super().__init__(alpha=alpha, iteration=iteration, lambda_=0, solver=solver,
+                         optimizer=optimizer, tol=tol, grad_tol=grad_tol,
+                         record_every=record_every)
 
-        
-        self.sse_values = []
+
+    @property
+    def sse_values(self):
+        """
+        SSE recorded during training. Without a penalty it is the same as loss_history.
+        """
+
+        return self.loss_history
 
 
     def fit_r(self, X, y):
         """
-        Train Linear Regression using Gradient Descent.
+        Train Linear Regression using Gradient Descent,
+        or with a closed-form solver when self.solver is not "gd".
 
         Parameters:
-        X (array-like): input feature values
+        X (array-like): input feature values, shape (n_samples,) or (n_samples, n_features)
         y (array-like): true target values
         """
 
-        n = len(X)
+        self._check_solver(("gd",) + self.CLOSED_FORM_SOLVERS)
 
-        for i in range(self.iteration):
+        X = self._as_matrix(X)
+        y = np.asarray(y, dtype=float).reshape(-1)
 
-            
-            y_hat = self.predict(X)
+        if self.solver != "gd":
 
-            
-            D_w = (2/n) * np.sum((y_hat - y) * X)
-            D_b = (2/n) * np.sum(y_hat - y)
+            self.w, self.b = self._solve_closed_form(X, y)
 
-            
-            self.w -= self.alpha * D_w
-            self.b -= self.alpha * D_b
+            residual = self.predict(X) - y
+            sse = np.dot(residual, residual)
 
-            
-            sse = np.sum((y_hat - y) ** 2)
+            self._append_loss(sse)
 
-        
-            self.loss_history.append(sse)
-            self.sse_values.append(sse)
+            return
+
+        self._gradient_descent(X, y)
+
+
+    def _record_loss(self, i, sse, loss):
+        """
+        Store the SSE of iteration i and print about every 20 iterations.
+
+        Only every record_every-th iteration gets here, so the print is
+        counted in recorded values: every max(1, 20 // record_every)-th one.
+        """
+
+        self._append_loss(sse)
+
+        n_recorded = i // self.record_every + 1
 
-            
-            if (i + 1) % 20 == 0:
-                print(f"Iteration {i+1}, SSE = {sse}")
+        if n_recorded % max(1, 20 // self.record_every) == 0:
+            print(f"Iteration {i+1}, SSE = {sse}")
 
 
     def pred_Y(self, X_new):
@@ -90,7 +115,7 @@ class LinearRegression_r(BaseLinearModel):
 
         
         plt.subplot(1,2,1)
-        plt.plot(range(self.iteration), self.loss_history, label="SSE")
+        plt.plot(np.arange(len(self.loss_history)) * self.record_every, self.loss_history, label="SSE")
         plt.xlabel("Iteration")
         plt.ylabel("Sum Squared Error")
         plt.title("Training Error Curve")
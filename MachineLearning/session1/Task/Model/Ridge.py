@@ -10,37 +10,57 @@ preventing the weights from becoming too large.
 
 The penalty used here is L2 regularization, which adds lambda * w²
 to the loss function.
+
+Besides Gradient Descent (solver="gd", the default) the exact solution can be
+computed in one pass with solver="normal", "cholesky", "qr" or "svd".
 """
 
 class RidgeRegression(BaseLinearModel):
     
     def fit(self, X, y):
         """
-        Train the Ridge Regression model using Gradient Descent.
+        Train the Ridge Regression model using Gradient Descent,
+        or with a closed-form solver when self.solver is not "gd".
 
         Parameters
         
         X_type : numpy array
-            Input feature values
+            Input feature values, shape (n_samples,) or (n_samples, n_features)
         
         y_type : numpy array
             Actual target values
         """
         
-        n = len(X)
-        
-        for i in range(self.iteration):
-            
-            y_hat = self.predict(X)
-            
-            D_w = (2/n) * np.sum((y_hat - y) * X) + 2 * self.lambda_ * self.w
-            
-            D_b = (2/n) * np.sum(y_hat - y)
-            
-            self.w -= self.alpha * D_w
-            
-            self.b -= self.alpha * D_b
-            
-            loss = np.sum((y_hat - y)**2) + self.lambda_ * np.sum(self.w**2)
-             
-            self.loss_history.append(loss)
+        self._check_solver(("gd",) + self.CLOSED_FORM_SOLVERS)
+
+        X = self._as_matrix(X)
+        y = np.asarray(y, dtype=float).reshape(-1)
+
+        if self.solver != "gd":
+
+            self.w, self.b = self._solve_closed_form(X, y, self.lambda_)
+
+            residual = self.predict(X) - y
+            loss = np.dot(residual, residual) + self.lambda_ * np.dot(self.w, self.w)
+
+            self._append_loss(loss)
+
+            return
+
+        self._gradient_descent(X, y)
+
+
+    def _penalty_gradient(self):
+        """
+        Gradient of the L2 penalty lambda * w².
+        """
+
+        return 2 * self.lambda_ * self.w
+
+
+    def _penalty(self):
+        """
+        Value of the L2 penalty lambda * w².
+        """
+
+        return self.lambda_ * np.dot(self.w, self.w)
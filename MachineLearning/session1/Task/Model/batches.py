@@ -0,0 +1,63 @@
+import numpy as np
+
+"""
+Batch helpers for mini-batch and streaming training.
+
+These generators feed BaseLinearModel.fit_batches / partial_fit.
+They only slice the input arrays, so for a memory-mapped .npy file
+each batch is read from disk when it is used and the process memory
+stays constant, however large the file is.
+"""
+
+
+def iter_batches(X, y, batch_size: int, shuffle: bool = False, seed=None):
+    """
+    Yield (X_batch, y_batch) chunks of consecutive rows.
+
+    Parameters:
+    X (array-like): Input features, can be a numpy memmap
+    y (array-like): Target values with the same number of rows as X
+    batch_size (int): Number of rows per batch, the last batch can be smaller
+    shuffle (bool): Visit the batches in a random order (rows inside a batch stay contiguous)
+    seed (int): Seed used when shuffle is True
+
+    Yields:
+    tuple: (X_batch, y_batch)
+    """
+
+    n_samples = len(X)
+
+    if len(y) != n_samples:
+        raise ValueError("X and y must have the same number of rows.")
+
+    starts = np.arange(0, n_samples, batch_size)
+
+    if shuffle:
+        np.random.default_rng(seed).shuffle(starts)
+
+    for start in starts:
+        stop = start + batch_size
+        yield np.asarray(X[start:stop]), np.asarray(y[start:stop])
+
+
+def iter_npy_batches(X_path, y_path, batch_size: int, shuffle: bool = False, seed=None):
+    """
+    Yield batches from .npy files without loading them into memory.
+
+    Both files are opened with np.load(..., mmap_mode="r").
+
+    Parameters:
+    X_path (str): Path to the .npy file with the features
+    y_path (str): Path to the .npy file with the targets
+    batch_size (int): Number of rows per batch
+    shuffle (bool): Visit the batches in a random order
+    seed (int): Seed used when shuffle is True
+
+    Yields:
+    tuple: (X_batch, y_batch)
+    """
+
+    X = np.load(X_path, mmap_mode="r")
+    y = np.load(y_path, mmap_mode="r")
+
+    yield from iter_batches(X, y, batch_size, shuffle=shuffle, seed=seed)
@@ -1,3 +1,5 @@
+import weakref
+
 import numpy as np
 from Model.LinearRegression import LinearRegression_r
 
@@ -9,101 +11,481 @@ the model to learn non-linear relationships between input (X) and output (y)
 by transforming the original feature into higher-degree polynomial features.
 
 This allows the model to fit curves instead of just straight lines.
+
+Several input features are supported. With interaction=True the expansion
+contains every monomial up to the degree (x1*x2, x1²*x2, ...), otherwise
+only the powers of each feature. The expansion can be emitted as a sparse
+matrix (needs scipy). With cache=True fit and repeated predict calls on
+the same X array expand it only once.
+
+Raw powers of X have very different scales, which forces a tiny alpha.
+The scaling option fixes this with statistics computed once in fit and
+reused by transform/predict:
+- "standard": every expanded column is standardized to mean 0, std 1
+- "chebyshev" / "legendre": every feature is mapped to [-1, 1] and the
+  powers x^k are replaced by the orthogonal polynomials T_k / P_k
 """
 
 class PolynomialRegression(LinearRegression_r):
-    
-    def __init__(self, degree=2, alpha=0.01, iterations=100):
+
+    def __init__(self, degree=2, alpha=0.01, iterations=100, optimizer="gd", tol=None, grad_tol=None,
+                 record_every=1, interaction=False, sparse=False, cache=False, scaling=None):
         """
         Initialize the Polynomial Regression model.
 
         Parameters
-        
+
         degree : int
             The maximum polynomial degree to generate.
             Example: degree=3 → creates x, x², x³
-        
+
         alpha : float
             Learning rate used in Gradient Descent.
             Controls how fast weights are updated.
-        
+
         iterations : int
-            Number of Gradient Descent iterations.
+            Maximum number of Gradient Descent iterations.
             More iterations allow better convergence.
+
+        optimizer : str
+            "gd" (default), "momentum", "nesterov", "adam" or "line_search".
+
+        tol, grad_tol : float
+            Stop early when the relative loss change / gradient norm
+            falls below this value.
+
+        record_every : int
+            Record the loss only every record_every iterations.
+
+        interaction : bool
+            Also create the products between different features.
+
+        sparse : bool
+            Return the expanded features as a scipy.sparse CSR matrix.
+
+        cache : bool
+            Reuse the last expansion when the same X array is passed again
+            (off by default). The cache is keyed on the array object only,
+            so an array modified in place (e.g. a reused scoring buffer)
+            would get stale predictions; only enable it for read-only inputs.
+
+        scaling : str or None
+            None (default), "standard", "chebyshev" or "legendre".
+            With sparse=True only "standard" is possible, and the columns
+            are then divided by their std without centering.
         """
-        
-       
-        super().__init__(alpha, iterations)
-        
-        
+
+
+        super().__init__(alpha, iterations, optimizer=optimizer, tol=tol, grad_tol=grad_tol,
+                         record_every=record_every)
+
+
         self.degree = degree
-    
-    
+        self.interaction = interaction
+        self.sparse = sparse
+        self.cache = cache
+        self.scaling = scaling
+
+        # Scaling statistics, computed in fit
+        self.poly_mean = None
+        self.poly_std = None
+        self.x_center = None
+        self.x_half_range = None
+
+        self._cache_ref = None
+        self._cache_key = None
+        self._cache_value = None
+
+
+    def _expansion_plan(self, n_features):
+        """
+        Describe every generated column as (parent column, input feature).
+
+        The first n_features output columns are the inputs themselves.
+        Every following column is an earlier output column multiplied by
+        one input feature, so each power/monomial is built with a single
+        multiplication from the one below it (cumulative products).
+
+        Returns
+
+        parents, features : list
+            Output column n_features + c = column parents[c] * feature features[c]
+
+        monomials : list
+            The features multiplied together in every output column, e.g. (0, 0, 1) for x0²*x1
+        """
+
+        parents = []
+        features = []
+        monomials = [(j,) for j in range(n_features)]
+
+        # Monomials of the previous degree as (output column, last feature used)
+        previous = [(j, j) for j in range(n_features)]
+        next_column = n_features
+
+        for d in range(2, self.degree + 1):
+
+            current = []
+
+            for column, last in previous:
+
+                # Only multiply by features from `last` on, so every monomial
+                # is generated once (x1*x2 but not x2*x1). Without interactions
+                # a power of x_j is only multiplied by x_j again.
+                stop = n_features if self.interaction else last + 1
+
+                for j in range(last, stop):
+
+                    parents.append(column)
+                    features.append(j)
+                    monomials.append(monomials[column] + (j,))
+                    current.append((next_column, j))
+                    next_column += 1
+
+            previous = current
+
+        return parents, features, monomials
+
+
     def transform(self, X):
         """
-        Transform original input features into polynomial features.
+        Transform original input features into the (scaled) polynomial features
+        the model is trained on.
 
         Parameters
-        
-        X_type : numpy array
-           x_parameter: Original input feature vector
+
+        X_type : numpy array or scipy.sparse matrix
+           x_parameter: Original input features, shape (n_samples,) or (n_samples, n_features)
 
         Returns
-        
-        X_poly : numpy array
-            Rtype:Transformed feature matrix with polynomial features
-        """
-        
-        
-        X_poly = X
-        
-        
-        for d in range(2, self.degree + 1):
-            
-            
-            X_poly = np.column_stack((X_poly, X**d))   # Add a new column with X raised to power d.
-            
+
+        X_poly : numpy array or scipy.sparse CSR matrix
+            Rtype:Transformed feature matrix with polynomial features,
+            all columns of degree 1 first, then degree 2, and so on
+        """
+
+        return self._standardize(self._polynomial_features(X))
+
+
+    def _polynomial_features(self, X):
+        """
+        Expand X into polynomial (or orthogonal basis) columns, before standardization.
+        """
+
+        self._check_scaling()
+
+        if self.sparse or hasattr(X, "tocsc"):
+            return self._transform_sparse(X)
+
+        X = np.asfortranarray(self._as_matrix(X))
+        n_samples, n_features = X.shape
+
+        parents, features, monomials = self._expansion_plan(n_features)
+
+        if self.scaling in ("chebyshev", "legendre"):
+            return self._basis_features(X, monomials)
+
+        # One preallocated, column-major output: every column is written once
+        X_poly = np.empty((n_samples, n_features + len(parents)), order="F")
+        X_poly[:, :n_features] = X
+
+        for column, (parent, j) in enumerate(zip(parents, features), start=n_features):
+            np.multiply(X_poly[:, parent], X[:, j], out=X_poly[:, column])   # Next power from the previous one.
+
+        return X_poly
+
+
+    def _basis_features(self, X, monomials):
+        """
+        Build the columns from Chebyshev or Legendre polynomials instead of raw powers.
+
+        Every feature is first mapped to [-1, 1] with the range seen in fit,
+        then B_k(z) is evaluated with the three-term recurrence
+            Chebyshev: T_k+1 = 2 z T_k - T_k-1
+            Legendre:  (k+1) P_k+1 = (2k+1) z P_k - k P_k-1
+        A monomial like x0²*x1 becomes B_2(z0) * B_1(z1).
+        """
+
+        if self.x_center is None:
+            Z = X
+        else:
+            Z = (X - self.x_center) / self.x_half_range
+
+        basis = np.empty((self.degree + 1,) + Z.shape)
+        basis[0] = 1.0
+        basis[1] = Z
+
+        for k in range(1, self.degree):
+            if self.scaling == "chebyshev":
+                basis[k + 1] = 2 * Z * basis[k] - basis[k - 1]
+            else:
+                basis[k + 1] = ((2 * k + 1) * Z * basis[k] - k * basis[k - 1]) / (k + 1)
+
+        X_poly = np.empty((Z.shape[0], len(monomials)), order="F")
+
+        for column, monomial in enumerate(monomials):
+
+            out = X_poly[:, column]
+            first = True
+
+            for j in sorted(set(monomial)):
+
+                term = basis[monomial.count(j), :, j]
+
+                if first:
+                    out[:] = term
+                    first = False
+                else:
+                    out *= term
+
         return X_poly
-    
-    
+
+
+    def _check_scaling(self):
+        """
+        Raise a ValueError for an unknown or unsupported scaling option.
+        """
+
+        if self.scaling not in (None, "standard", "chebyshev", "legendre"):
+            raise ValueError(
+                f"Unknown scaling '{self.scaling}'. Choose None, 'standard', 'chebyshev' or 'legendre'"
+            )
+
+        if self.sparse and self.scaling in ("chebyshev", "legendre"):
+            raise ValueError("Orthogonal bases are dense, use scaling='standard' with sparse=True")
+
+
+    def _fit_scaling(self, X):
+        """
+        Compute the scaling statistics from the training data and return
+        the expanded, scaled training matrix.
+        """
+
+        self._check_scaling()
+
+        # New statistics make every cached expansion stale
+        self._cache_ref = None
+        self.poly_mean = None
+        self.poly_std = None
+        self.x_center = None
+        self.x_half_range = None
+
+        if self.scaling in ("chebyshev", "legendre"):
+
+            X_raw = self._as_matrix(X)
+            low = X_raw.min(axis=0)
+            high = X_raw.max(axis=0)
+
+            self.x_center = (high + low) / 2
+            self.x_half_range = (high - low) / 2
+            self.x_half_range[self.x_half_range == 0] = 1.0
+
+        X_poly = self._polynomial_features(X)
+
+        if self.scaling == "standard":
+
+            if hasattr(X_poly, "tocsr"):
+                mean = np.asarray(X_poly.mean(axis=0)).reshape(-1)
+                mean_sq = np.asarray(X_poly.multiply(X_poly).mean(axis=0)).reshape(-1)
+                std = np.sqrt(np.maximum(mean_sq - mean ** 2, 0))
+            else:
+                mean = X_poly.mean(axis=0)
+                std = X_poly.std(axis=0)
+
+            std[std == 0] = 1.0   # Constant columns are only centered
+
+            self.poly_mean = mean
+            self.poly_std = std
+
+        return self._standardize(X_poly)
+
+
+    def _standardize(self, X_poly):
+        """
+        Apply the standardization computed in fit (in place for dense arrays).
+        """
+
+        if self.poly_std is None:
+            return X_poly
+
+        if hasattr(X_poly, "tocsr"):
+            from scipy import sparse
+
+            # Centering would destroy the sparsity, so sparse columns are only scaled
+            return (X_poly @ sparse.diags(1 / self.poly_std)).tocsr()
+
+        X_poly -= self.poly_mean
+        X_poly /= self.poly_std
+
+        return X_poly
+
+
+    def _transform_sparse(self, X):
+        """
+        Same expansion as transform, built column by column as a sparse matrix.
+        """
+
+        try:
+            from scipy import sparse
+        except ImportError as error:
+            raise ImportError("sparse=True needs scipy: pip install scipy") from error
+
+        if not sparse.issparse(X):
+            X = self._as_matrix(X)
+
+        X = sparse.csc_matrix(X, dtype=float)
+        n_features = X.shape[1]
+
+        parents, features, monomials = self._expansion_plan(n_features)
+
+        columns = [X[:, j] for j in range(n_features)]
+
+        for parent, j in zip(parents, features):
+            columns.append(columns[parent].multiply(columns[j]))
+
+        return sparse.hstack(columns, format="csr")
+
+
+    def _expand(self, X):
+        """
+        Return transform(X), reusing the cached result for the same X object.
+        """
+
+        settings = (self.degree, self.interaction, self.sparse, self.scaling)
+
+        if self.cache and self._cache_ref is not None:
+            if self._cache_ref() is X and self._cache_key == settings:
+                return self._cache_value
+
+        return self._remember(X, self.transform(X))
+
+
+    def _remember(self, X, X_poly):
+        """
+        Cache X_poly as the expansion of the X object and return it.
+        """
+
+        settings = (self.degree, self.interaction, self.sparse, self.scaling)
+
+        if self.cache:
+            try:
+                self._cache_ref = weakref.ref(X)
+            except TypeError:
+                # Lists and scalars can not be referenced weakly, so they are not cached
+                self._cache_ref = None
+            else:
+                self._cache_key = settings
+                self._cache_value = X_poly
+
+        return X_poly
+
+
     def fit(self, X, y):
         """
         Train the Polynomial Regression model using Gradient Descent.
 
         Steps performed:
         1. Transform input features into polynomial features
+           (computing the scaling statistics when scaling is set)
         2. Initialize weights and bias
         3. Perform gradient descent to minimize error
         4. Store loss values for analysis
 
         Parameters
-        
+
         X_type : numpy array
            :x_parameter: Input feature vector
-        
+
         y_type : numpy array
             :y_parameter:True target values
         """
-        
-        X_poly = self.transform(X)
-    
-        self.w = np.zeros(X_poly.shape[1])
-        
-        self.b = 0
-        
-        n = len(X)
-        
-        for i in range(self.iteration):
-            
-            y_hat = np.dot(X_poly, self.w) + self.b
-            
-            D_w = (2/n) * np.dot(X_poly.T, (y_hat - y))
-            
-            D_b = (2/n) * np.sum(y_hat - y)
-            
-            self.w -= self.alpha * D_w
-            self.b -= self.alpha * D_b
-            
-            loss = np.sum((y_hat - y)**2)
-            
-            self.loss_history.append(loss)
+
+        X_poly = self._remember(X, self._fit_scaling(X))
+        y = np.asarray(y, dtype=float).reshape(-1)
+
+        self._gradient_descent(X_poly, y)
+
+
+    def fit_r(self, X, y):
+        """
+        Same as fit. The inherited fit_r would train on the raw X,
+        while predict expects the weights of the expanded features.
+        """
+
+        self.fit(X, y)
+
+
+    def _init_args(self):
+        """
+        Constructor arguments that rebuild this model.
+        """
+
+        return {
+            "degree": self.degree, "alpha": self.alpha, "iterations": self.iteration,
+            "optimizer": self.optimizer, "tol": self.tol, "grad_tol": self.grad_tol,
+            "record_every": self.record_every, "interaction": self.interaction,
+            "sparse": self.sparse, "cache": self.cache, "scaling": self.scaling
+        }
+
+
+    def _state(self):
+        """
+        Weights plus the scaling statistics computed in fit.
+        """
+
+        state = super()._state()
+
+        state.update(poly_mean=self.poly_mean, poly_std=self.poly_std,
+                     x_center=self.x_center, x_half_range=self.x_half_range)
+
+        return state
+
+
+    def _load_state(self, state):
+        """
+        Restore the weights and the scaling statistics.
+        """
+
+        super()._load_state(state)
+
+        self.poly_mean = state.get("poly_mean")
+        self.poly_std = state.get("poly_std")
+        self.x_center = state.get("x_center")
+        self.x_half_range = state.get("x_half_range")
+
+
+    def _record_loss(self, i, sse, loss):
+        """
+        Store the loss of iteration i without printing progress.
+        """
+
+        self._append_loss(loss)
+
+
+    def partial_fit(self, X_batch, y_batch):
+        """
+        Perform one gradient descent step on a batch of original features.
+
+        The batch is expanded into polynomial features before the step,
+        so the stream can contain the raw input values.
+        """
+
+        super().partial_fit(self.transform(X_batch), y_batch)
+
+
+    def predict(self, X):
+        """
+        Predict the output for original (not yet expanded) input features.
+
+        Parameters
+
+        X_type : numpy array
+           x_parameter: Original input features
+
+        Returns
+
+        y_pred : numpy array
+            Rtype:Predicted output values
+        """
+
+        return self._expand(X) @ np.atleast_1d(self.w) + self.b
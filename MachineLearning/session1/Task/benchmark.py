@@ -0,0 +1,63 @@
+"""
+benchmark.py
+
+This file measures the training throughput of the matrix-based
+gradient descent engine shared by the session1 regression models.
+
+For each feature count the same number of samples is trained for a fixed
+number of iterations, and the throughput is reported as processed
+matrix cells (n_samples * n_features * iterations) per second.
+Because every step is a single matmul, wider tables use the hardware
+better and the throughput should rise as the feature count grows.
+
+Run it from the Task folder:
+python benchmark.py
+"""
+
+import time
+
+import numpy as np
+
+from Model.Ridge import RidgeRegression
+
+
+def benchmark_features(feature_counts=(1, 10, 50, 100, 500), n_samples=5000, iteration=200, seed=0):
+    """
+    Time RidgeRegression.fit for different numbers of features.
+
+    Parameters:
+    feature_counts (tuple): Feature counts to benchmark
+    n_samples (int): Number of rows in every synthetic dataset
+    iteration (int): Gradient descent iterations per fit
+    seed (int): Seed of the random generator
+
+    Returns:
+    list: One (n_features, seconds, cells_per_second) tuple per feature count
+    """
+
+    rng = np.random.default_rng(seed)
+    results = []
+
+    for n_features in feature_counts:
+
+        X = rng.standard_normal((n_samples, n_features))
+        y = X @ rng.standard_normal(n_features) + 3.0
+
+        model = RidgeRegression(alpha=0.01, iteration=iteration, lambda_=0.1)
+
+        start = time.perf_counter()
+        model.fit(X, y)
+        seconds = time.perf_counter() - start
+
+        cells_per_second = n_samples * n_features * iteration / seconds
+        results.append((n_features, seconds, cells_per_second))
+
+    return results
+
+
+if __name__ == "__main__":
+
+    print(f"{'features':>10} {'seconds':>10} {'cells/sec':>14}")
+
+    for n_features, seconds, cells_per_second in benchmark_features():
+        print(f"{n_features:>10} {seconds:>10.4f} {cells_per_second:>14.3e}")
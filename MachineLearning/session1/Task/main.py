@@ -11,6 +11,8 @@ from Model.LinearRegression import LinearRegression_r
 from Model.Ridge import RidgeRegression
 from Model.Lasso import LassoRegression
 from Preprocessing.Polynomial import PolynomialRegression
+from Model.batches import iter_batches
+from Model.BatchedRegression import BatchedRegression
 
 
 X = np.array([1, 2, 3, 4, 5])
@@ -44,3 +46,67 @@ prediction = np.dot(X_poly, poly.w) + poly.b
 
 print("Polynomial prediction for x=6:", prediction)
 
+
+
+print("\nComparing Gradient Descent with the closed-form solvers")
+X_multi = np.column_stack((X, X ** 2 / 10))
+
+for solver in ["normal", "cholesky", "qr", "svd"]:
+
+    gd = RidgeRegression(alpha=0.01, iteration=20000, lambda_=0.1)
+    gd.fit(X_multi, y)
+
+    exact = RidgeRegression(alpha=0.01, iteration=20000, lambda_=0.1, solver=solver)
+    exact.fit(X_multi, y)
+
+    same = np.allclose(gd.w, exact.w, atol=1e-4) and np.isclose(gd.b, exact.b, atol=1e-4)
+    print(f"Ridge {solver:>8}: w = {exact.w}, b = {exact.b:.4f}, matches GD: {same}")
+
+    exact_linear = LinearRegression_r(alpha=0.01, solver=solver)
+    exact_linear.fit_r(X, y)
+    print(f"Linear {solver:>7}: w = {exact_linear.w}, b = {exact_linear.b:.4f}")
+
+
+print("\nLasso with Coordinate Descent and a warm-started path")
+lasso_cd = LassoRegression(alpha=0.01, iteration=100, lambda_=0.1, solver="cd")
+lasso_cd.fit(X_multi, y)
+print("Lasso (cd) weights:", lasso_cd.w, "bias:", lasso_cd.b)
+
+lambdas = [10, 3, 1, 0.3, 0.1]
+path_w, path_b = lasso_cd.lasso_path(X_multi, y, lambdas)
+
+for lam, w, b in zip(lambdas, path_w, path_b):
+    print(f"lambda = {lam:>4}: w = {w}, b = {b:.4f}")
+
+
+print("\nMini-batch training on a stream of chunks")
+streamed = RidgeRegression(alpha=0.01, iteration=0, lambda_=0.1)
+streamed.fit_batches(lambda: iter_batches(X_multi, y, batch_size=2, shuffle=True, seed=0), epochs=3000)
+print("Ridge (mini-batch) weights:", streamed.w, "bias:", streamed.b)
+
+
+print("\nEarly stopping and adaptive optimizers")
+for optimizer in ["gd", "momentum", "nesterov", "adam", "line_search"]:
+    model = RidgeRegression(alpha=0.01, iteration=20000, lambda_=0.1, optimizer=optimizer, tol=1e-12)
+    model.fit(X_multi, y)
+    print(f"{optimizer:>11}: stopped after {model.n_iter:>5} iterations, w = {model.w}, b = {model.b:.4f}")
+
+
+print("\nHigh-degree Polynomial Regression with built-in scaling")
+X_curve = np.linspace(0, 5, 50)
+y_curve = 3 * np.sin(X_curve) + X_curve
+
+for scaling in ["standard", "chebyshev", "legendre"]:
+    poly10 = PolynomialRegression(degree=10, alpha=1.0, iterations=5000, optimizer="line_search",
+                                  tol=1e-12, scaling=scaling)
+    poly10.fit(X_curve, y_curve)
+    print(f"{scaling:>9}: {poly10.n_iter:>4} iterations, prediction for x=2.5: {poly10.predict(2.5)[0]:.4f}"
+          f" (true {3 * np.sin(2.5) + 2.5:.4f})")
+
+
+print("\nBatched lambda sweep for Ridge Regression")
+sweep = BatchedRegression(lambdas=np.geomspace(0.001, 10, 100), alphas=[0.01], iteration=5000)
+loss_grid = sweep.fit(X_multi, y)
+best_index, val_mse = sweep.best(X_multi, y)
+print("Loss grid shape:", loss_grid.shape)
+print(f"Best lambda: {sweep.lambda_grid[best_index]:.4f}, w = {sweep.W[best_index]}, b = {sweep.B[best_index]:.4f}")
@@ -1,6 +1,11 @@
+import json
+from collections.abc import Iterator
+
 import numpy as np
 import matplotlib.pyplot as plt
 
+from RunningStats import RunningStats
+
 
 """
 LinearRegressionGD
@@ -19,12 +24,22 @@ Where:
 The goal is to minimize the Sum of Squared Errors (SSE)
 between predicted and actual values by iteratively updating
 the parameters using Gradient Descent.
+
+Data that does not fit in memory can be trained with fit_chunks,
+which reads the chunks once and accumulates streaming statistics.
+
+A trained model is stored with save() as a small uncompressed .npz
+(weights, bias, normalization statistics and the settings as JSON)
+and restored with LinearRegressionGD.load(), without pickle.
 """
 
 
 class LinearRegressionGD():
 
-    def __init__(self, learning_rate=0.001, n_iters=100, normalize=False):
+    # Version of the save() file layout, stored in every file
+    FORMAT_VERSION = 1
+
+    def __init__(self, learning_rate=0.001, n_iters=100, normalize=False, dtype=np.float64):
         """
         Initialize the model.
 
@@ -40,11 +55,17 @@ class LinearRegressionGD():
 
         normalize : bool
             If True, features will be normalized before training.
+
+        dtype : numpy dtype
+            Floating point type used for training and prediction.
+            np.float32 halves the memory traffic on wide datasets,
+            at the cost of precision.
         """
 
         self.alpha = learning_rate
         self.n_iters = n_iters
         self.normalize = normalize
+        self.dtype = np.dtype(dtype)
 
         # Model parameters
         self.weight = None
@@ -57,15 +78,144 @@ class LinearRegressionGD():
         self.mean = None
         self.std = None
 
+        # True after fit_stats: fit then reuses mean / std
+        self.stats_fixed = False
+
     def _normalize(self, X):
         """
         Normalize features using Z-score normalization.
+
+        Constant columns (std ~ 0, see RunningStats.std) get std = 1 and are only centered.
+        The statistics from fit_stats are used when they were computed.
+        """
+        if not self.stats_fixed:
+            # The statistics are computed block by block in float64, so the
+            # normalized X below is the only full-size copy
+            stats = RunningStats().update(X)
+            self.mean = stats.mean.astype(self.dtype)
+            self.std = stats.std.astype(self.dtype)
+
+        # One copy of X, scaled in place
+        X_norm = X - self.mean
+        X_norm /= self.std
+        return X_norm
+
+    def _as_input(self, X):
+        """
+        Convert X to a C-contiguous 2D array of self.dtype.
+
+        No copy is made when X already is one.
         """
-        self.mean = np.mean(X, axis=0)
-        self.std = np.std(X, axis=0)
-        return (X - self.mean) / self.std
 
-    def fit(self, X, y):
+        X = np.ascontiguousarray(X, dtype=self.dtype)
+
+        if X.ndim == 0:
+            X = X.reshape(1, 1)
+        elif X.ndim == 1:
+            X = X.reshape(-1, 1)
+
+        return X
+
+    def fit_stats(self, chunks):
+        """
+        Compute the normalization statistics chunk by chunk.
+
+        A following fit(normalize=True) uses these statistics instead of
+        computing them from its X again, e.g. when they should describe a
+        larger (memory-mapped) dataset than the array that is trained on.
+
+        Parameters:
+        -----------
+        chunks : iterable
+            Yields X chunks of shape (n_rows, n_features), e.g. slices
+            of a memory-mapped array. Each chunk is read once.
+        """
+
+        stats = RunningStats()
+
+        for X_chunk in chunks:
+            stats.update(X_chunk)
+
+        self.mean = stats.mean.astype(self.dtype)
+        self.std = stats.std.astype(self.dtype)
+        self.stats_fixed = True
+
+        return self
+
+    def fit_chunks(self, chunks):
+        """
+        Train the model on data that arrives in chunks, in a single pass.
+
+        Full-batch Gradient Descent on the squared error only needs the
+        data through X^T X, X^T y, y^T y and the means. These are
+        accumulated with RunningStats while the chunks are read once,
+        together with the normalization statistics, and the
+        n_iters Gradient Descent steps then run on these
+        (n_features x n_features) summaries.
+
+        The result is the same as fit on the concatenated data,
+        but memory does not grow with the number of rows.
+
+        Parameters:
+        -----------
+        chunks : iterable
+            Yields (X_chunk, y_chunk) tuples.
+        """
+
+        stats = RunningStats(covariance=True)
+
+        for X_chunk, y_chunk in chunks:
+            stats.update(X_chunk, y_chunk)
+
+        n = stats.n
+
+        if self.normalize:
+            self.mean = stats.mean.astype(self.dtype)
+            self.std = stats.std.astype(self.dtype)
+            self.stats_fixed = False
+            center = stats.mean
+            scale = stats.std
+        else:
+            center = np.zeros_like(stats.mean)
+            scale = np.ones_like(stats.mean)
+
+        # Summaries of the transformed features A = (X - center) / scale
+        offset = stats.mean - center
+        AtA = (stats.comoment + n * np.outer(offset, offset)) / np.outer(scale, scale)
+        Aty = (stats.comoment_xy + n * offset * stats.mean_y) / scale
+        sum_A = n * offset / scale
+        sum_y = n * stats.mean_y
+        yty = stats.m2_y + n * stats.mean_y ** 2
+
+        n_features = AtA.shape[0]
+
+        self.weight = np.zeros(n_features)
+        self.bias = 0
+
+        for _ in range(self.n_iters):
+
+            # X^T (y_pred - y) and sum(y_pred - y) without the data
+            AtA_w = AtA @ self.weight
+            sum_pred = np.dot(sum_A, self.weight) + n * self.bias
+
+            dw = (2 / n) * (AtA_w + self.bias * sum_A - Aty)
+            db = (2 / n) * (sum_pred - sum_y)
+
+            # SSE = |A w + b|² - 2 y.(A w + b) + y.y
+            sse = (np.dot(self.weight, AtA_w) + 2 * self.bias * np.dot(sum_A, self.weight)
+                   + n * self.bias ** 2 - 2 * (np.dot(self.weight, Aty) + self.bias * sum_y) + yty)
+
+            self.weight -= self.alpha * dw
+            self.bias -= self.alpha * db
+
+            self.sse_history.append(sse)
+
+        self.weight = self.weight.astype(self.dtype)
+        self.bias = self.dtype.type(self.bias)
+
+        return self
+
+    def fit(self, X, y, callback=None):
         """
         Train the model using Gradient Descent.
 
@@ -75,14 +225,18 @@ class LinearRegressionGD():
         3) Compute gradients.
         4) Update parameters.
         5) Store SSE to track convergence.
-        """
 
-        X = np.array(X)
-        y = np.array(y).reshape(-1)
+        X and y are used without copying when they already are
+        contiguous arrays of self.dtype (the only copy is the
+        normalized X when normalize=True).
 
-        # Ensure X is 2D (n_samples, n_features)
-        if X.ndim == 1:
-            X = X.reshape(-1, 1)
+        callback : callable, optional
+            Called as callback(iteration, sse) after every iteration,
+            e.g. to report progress from a worker thread.
+        """
+
+        X = self._as_input(X)
+        y = np.ascontiguousarray(y, dtype=self.dtype).reshape(-1)
 
         # Normalize features if enabled
         if self.normalize:
@@ -91,26 +245,37 @@ class LinearRegressionGD():
         n_samples, n_features = X.shape
 
         # Initialize parameters
-        self.weight = np.zeros(n_features)
-        self.bias = 0
+        self.weight = np.zeros(n_features, dtype=self.dtype)
+        self.bias = self.dtype.type(0)
 
-        for _ in range(self.n_iters):
+        # Buffers reused by every iteration
+        residual = np.empty(n_samples, dtype=self.dtype)
+        dw = np.empty(n_features, dtype=self.dtype)
 
-            # Compute predictions
-            y_pred = np.dot(X, self.weight) + self.bias
+        step = self.alpha * 2 / n_samples
 
-            # Compute gradients (CORRECTED)
-            dw = (2 / n_samples) * np.dot(X.T, (y_pred - y))
-            db = (2 / n_samples) * np.sum(y_pred - y)
+        for i in range(self.n_iters):
 
-            # Update parameters
-            self.weight -= self.alpha * dw
-            self.bias -= self.alpha * db
+            # residual = y_pred - y, computed in place
+            np.dot(X, self.weight, out=residual)
+            residual += self.bias
+            residual -= y
 
             # Compute SSE
-            sse = np.sum((y_pred - y) ** 2)
+            sse = np.dot(residual, residual)
+
+            # Compute gradients and update parameters in place
+            np.dot(residual, X, out=dw)
+            dw *= step
+
+            self.weight -= dw
+            self.bias -= self.dtype.type(step * residual.sum())
+
             self.sse_history.append(sse)
 
+            if callback is not None:
+                callback(i, sse)
+
         return self
 
     def predict(self, X):
@@ -127,18 +292,183 @@ class LinearRegressionGD():
             Predicted value(s)
         """
 
-        X = np.array(X)
-
-        if X.ndim == 0:
-            X = np.array([[X]])
-        elif X.ndim == 1:
-            X = X.reshape(-1, 1)
+        X = self._as_input(X)
 
         if self.normalize:
             X = (X - self.mean) / self.std
 
         return np.dot(X, self.weight) + self.bias
 
+    def _folded_params(self, centered=False):
+        """
+        Fold the normalization into the weights:
+
+            ((X - mean) / std) . w + b = X . (w / std) + (b - mean . (w / std))
+
+        so predictions need no normalized copy of X. With centered=True
+        only the std is folded in, (X - mean) . (w / std) + b, and the
+        caller subtracts the mean.
+
+        The folding is done in float64 and only the result is cast to
+        self.dtype, so the parameters themselves lose no precision.
+        """
+
+        if not self.normalize:
+            return self.weight, self.bias
+
+        weight = self.weight.astype(np.float64) / self.std.astype(np.float64)
+        bias = float(self.bias)
+
+        if not centered:
+            bias -= np.dot(self.mean.astype(np.float64), weight)
+
+        return weight.astype(self.dtype), self.dtype.type(bias)
+
+    def predict_batch(self, X, out=None, chunk_size=65536, chunked=False):
+        """
+        Predict many rows with as little overhead as possible.
+
+        The normalization is folded into the weights once per call, and
+        every block of chunk_size rows is a single matrix-vector product
+        written straight into the output.
+
+        In float32, X . (w / std) and the folded bias are large numbers
+        that cancel when the features' mean is large compared to their
+        std, so there every block is first centered in a reused buffer.
+
+        Parameters:
+        -----------
+        X : array-like or iterator
+            A (n_samples, n_features) array-like (e.g. a memory-mapped
+            array or a list of rows), or an iterator / generator yielding
+            such chunks.
+
+        out : numpy array, optional
+            1D array of self.dtype to write the predictions into.
+            For an iterable of chunks it must be long enough for all rows.
+
+        chunk_size : int
+            Number of rows processed at once for array input.
+
+        chunked : bool
+            Treat X as a sequence of chunks even though it is not an
+            iterator, e.g. a list of arrays.
+
+        Returns:
+        --------
+        numpy array with one prediction per row (out, when given)
+        """
+
+        centered = self.normalize and self.dtype.itemsize < 8
+        weight, bias = self._folded_params(centered)
+        buffer = None
+
+        if chunked or isinstance(X, Iterator):
+            chunks = (self._as_input(chunk) for chunk in X)
+            n_rows = None
+        else:
+            X = self._as_input(X)
+            chunks = (X[start:start + chunk_size] for start in range(0, X.shape[0], chunk_size))
+            n_rows = X.shape[0]
+
+        if out is None and n_rows is not None:
+            out = np.empty(n_rows, dtype=self.dtype)
+
+        if out is not None:
+            if out.ndim != 1 or out.dtype != self.dtype:
+                raise ValueError(f"out must be a 1D array of dtype {self.dtype}")
+            if n_rows is not None and out.shape[0] != n_rows:
+                raise ValueError(f"out has {out.shape[0]} rows, X has {n_rows}")
+
+        parts = []
+        start = 0
+
+        for chunk in chunks:
+
+            stop = start + chunk.shape[0]
+
+            if centered:
+                if buffer is None or buffer.shape[0] < chunk.shape[0]:
+                    buffer = np.empty(chunk.shape, dtype=self.dtype)
+                chunk = np.subtract(chunk, self.mean, out=buffer[:chunk.shape[0]])
+
+            if out is None:
+                parts.append(np.dot(chunk, weight))
+                parts[-1] += bias
+            else:
+                if stop > out.shape[0]:
+                    raise ValueError(f"out has only {out.shape[0]} rows")
+
+                target = out[start:stop]
+                np.dot(chunk, weight, out=target)
+                target += bias
+
+            start = stop
+
+        if out is None:
+            return np.concatenate(parts) if parts else np.empty(0, dtype=self.dtype)
+
+        return out[:start] if n_rows is None else out
+
+    def save(self, path):
+        """
+        Save the trained parameters and normalization statistics.
+
+        Parameters:
+        -----------
+        path : str
+            Target file, ".npz" is appended when missing.
+            The SSE history is not stored.
+        """
+
+        settings = {
+            "learning_rate": self.alpha,
+            "n_iters": self.n_iters,
+            "normalize": self.normalize,
+            "dtype": self.dtype.str
+        }
+
+        arrays = {"weight": self.weight, "bias": self.bias, "mean": self.mean, "std": self.std}
+        arrays = {name: np.asarray(value) for name, value in arrays.items() if value is not None}
+
+        np.savez(path, format_version=np.array(self.FORMAT_VERSION), settings=np.array(json.dumps(settings)),
+                 **arrays)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load a model written by save().
+
+        Parameters:
+        -----------
+        path : str
+            File written by save().
+
+        Returns:
+        --------
+        LinearRegressionGD ready to predict
+        """
+
+        with np.load(path) as data:
+
+            version = int(data["format_version"])
+
+            if version > cls.FORMAT_VERSION:
+                raise ValueError(f"{path} has format version {version}, "
+                                 f"this code reads up to {cls.FORMAT_VERSION}")
+
+            model = cls(**json.loads(str(data["settings"])))
+
+            if "weight" in data.files:
+                model.weight = data["weight"]
+                model.bias = data["bias"][()]
+
+            if "mean" in data.files:
+                model.mean = data["mean"]
+                model.std = data["std"]
+
+        return model
+
     def mse(self, y, y_pred):
         """
         Compute Mean Squared Error (MSE).
@@ -148,7 +478,7 @@ class LinearRegressionGD():
         """
         return np.mean((y - y_pred) ** 2)
 
-    def r2score(self, X, y):
+    def r2score(self, X, y, y_pred=None):
         """
         Compute R-squared score.
 
@@ -158,14 +488,111 @@ class LinearRegressionGD():
         R² = 1 → perfect fit
         R² = 0 → no explanatory power
         R² < 0 → worse than baseline
+
+        Pass y_pred to reuse predictions that were already computed.
+        """
+
+        return self.evaluate(X, y, y_pred=y_pred)["r2"]
+
+    def evaluate(self, X=None, y=None, y_pred=None, chunks=None, bins=None):
+        """
+        Compute all regression metrics in a single pass over the data.
+
+        Every chunk is predicted once (or its given predictions are used),
+        and the target and residual statistics are merged with
+        RunningStats, so the data is never scanned twice.
+
+        Parameters:
+        -----------
+        X, y : array-like
+            Features and true targets. X may be None when y_pred is given.
+
+        y_pred : array-like, optional
+            Existing predictions for y, used instead of predicting X.
+
+        chunks : iterable, optional
+            Instead of X / y: yields (X_chunk, y_chunk) or
+            (X_chunk, y_chunk, y_pred_chunk) tuples.
+
+        bins : array-like, optional
+            Bin edges for a histogram of the residuals (y - y_pred).
+
+        Returns:
+        --------
+        dict with mse, rmse, mae, r2 and the residual distribution
+        (residual_mean, residual_std, residual_min, residual_max,
+        and residual_hist when bins is given)
         """
 
-        y_pred = self.predict(X)
+        if chunks is None:
+            if y_pred is None:
+                X = self._as_input(X)
+            chunks = [(X, y, y_pred)]
+
+        target = RunningStats()
+        residuals = RunningStats()
+
+        abs_sum = 0.0
+        low = np.inf
+        high = -np.inf
+
+        if bins is not None:
+            bins = np.asarray(bins, dtype=float)
+            hist = np.zeros(len(bins) - 1, dtype=np.int64)
+
+        for chunk in chunks:
+
+            X_chunk, y_chunk = chunk[0], chunk[1]
+            y_pred_chunk = chunk[2] if len(chunk) > 2 else None
+
+            y_chunk = np.asarray(y_chunk, dtype=float).reshape(-1)
+
+            if y_pred_chunk is None:
+                y_pred_chunk = self.predict_batch(X_chunk)
+
+            residual = y_chunk - np.asarray(y_pred_chunk, dtype=float).reshape(-1)
+
+            if residual.size == 0:
+                continue
+
+            target.update(y_chunk)
+            residuals.update(residual)
+
+            low = min(low, residual.min())
+            high = max(high, residual.max())
+
+            if bins is not None:
+                hist += np.histogram(residual, bins=bins)[0]
+
+            np.abs(residual, out=residual)
+            abs_sum += residual.sum()
+
+        n = residuals.n
+
+        if n == 0:
+            raise ValueError("evaluate needs at least one sample")
+
+        # SSE = sum((r - mean_r)²) + n * mean_r²
+        sse = residuals.m2[0] + n * residuals.mean[0] ** 2
+        ss_total = target.m2[0]
+
+        mse = sse / n
+
+        metrics = {
+            "mse": mse,
+            "rmse": np.sqrt(mse),
+            "mae": abs_sum / n,
+            "r2": 1 - sse / ss_total if ss_total > 0 else np.nan,
+            "residual_mean": residuals.mean[0],
+            "residual_std": np.sqrt(residuals.var[0]),
+            "residual_min": low,
+            "residual_max": high
+        }
 
-        ss_total = np.sum((y - np.mean(y)) ** 2)
-        ss_residual = np.sum((y - y_pred) ** 2)
+        if bins is not None:
+            metrics["residual_hist"] = hist
 
-        return 1 - (ss_residual / ss_total)
+        return metrics
 
     def plot_training(self, X, y):
         """
@@ -1,10 +1,24 @@
+import queue
+import threading
+import time
 import tkinter as tk
+
 import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
 from ClassLinear import LinearRegressionGD
 
 
 class LinearRegressionApp:
 
+    # Training runs on a worker thread that sends (iteration, sse) every
+    # REPORT_EVERY iterations; the Tk loop reads them every POLL_MS and
+    # redraws the SSE curve at most MAX_FPS times per second.
+    REPORT_EVERY = 50
+    POLL_MS = 30
+    MAX_FPS = 20
+
     def __init__(self, root):
         self.root = root
         self.root.title("AMIT - Machine Learning Diploma")
@@ -17,16 +31,28 @@ class LinearRegressionApp:
         self.y = np.array([150, 180, 210, 240, 270])
 
         # -----------------------------
-        # Train Model
+        # Train Model (in the background)
         # -----------------------------
         self.model = LinearRegressionGD(
             learning_rate=0.000001,
             n_iters=10000,
             normalize=False
         )
-        self.model.fit(self.X, self.y)
+
+        self.progress = queue.Queue()
+        self.trained = False
+        self.train_error = None
+
+        # Sampled SSE curve received from the worker
+        self.sse_iters = []
+        self.sse_values = []
+
+        # Live plot window, created by show_plot
+        self.plot_window = None
+        self.last_draw = 0.0
 
         self.create_widgets()
+        self.start_training()
 
     def create_widgets(self):
 
@@ -128,11 +154,89 @@ class LinearRegressionApp:
         )
         self.result_label.pack(pady=20)
 
+    # =============================
+    # Background Training
+    # =============================
+    def start_training(self):
+
+        self.result_label.config(text="Training...", fg="black")
+
+        worker = threading.Thread(target=self._train, daemon=True)
+        worker.start()
+
+        self.root.after(self.POLL_MS, self._poll_training)
+
+    def _train(self):
+        """
+        Runs on the worker thread. Only talks to the GUI through the queue.
+        """
+
+        def report(i, sse):
+            if i % self.REPORT_EVERY == 0 or i == self.model.n_iters - 1:
+                self.progress.put(("progress", i, sse))
+
+        try:
+            self.model.fit(self.X, self.y, callback=report)
+        except Exception as error:
+            self.progress.put(("error", error, None))
+        else:
+            self.progress.put(("done", None, None))
+
+    def _poll_training(self):
+        """
+        Runs on the Tk thread: drain the queue, then update the label and plot.
+        """
+
+        finished = False
+
+        while True:
+            try:
+                kind, a, b = self.progress.get_nowait()
+            except queue.Empty:
+                break
+
+            if kind == "progress":
+                self.sse_iters.append(a)
+                self.sse_values.append(b)
+            elif kind == "done":
+                finished = True
+                self.trained = True
+            else:
+                finished = True
+                self.train_error = a
+                self.result_label.config(text=f"Training failed: {a}", fg="red")
+
+        if self.sse_iters and not finished:
+            self.result_label.config(
+                text=f"Training... {self.sse_iters[-1] + 1}/{self.model.n_iters}  SSE: {self.sse_values[-1]:.2f}",
+                fg="black"
+            )
+
+        if self.trained and finished:
+            self.result_label.config(text="Training finished", fg="green")
+
+        self._update_plot(force=finished)
+
+        if not finished:
+            self.root.after(self.POLL_MS, self._poll_training)
+
+    def _model_ready(self):
+
+        if self.train_error is not None:
+            self.result_label.config(text=f"Training failed: {self.train_error}", fg="red")
+        elif not self.trained:
+            self.result_label.config(text="The model is still training", fg="red")
+
+        return self.trained
+
     # =============================
     # Prediction
     # =============================
     def predict_price(self):
 
+        if not self._model_ready():
+            return
+
         try:
             size = float(self.size_entry.get())
 
@@ -154,6 +258,9 @@ class LinearRegressionApp:
     # =============================
     def show_parameters(self):
 
+        if not self._model_ready():
+            return
+
         self.result_label.config(
             text=f"θ0 (Bias): {self.model.bias:.4f}\nθ1 (Weight): {self.model.weight[0]:.4f}",
             fg="black"
@@ -163,7 +270,113 @@ class LinearRegressionApp:
     # Show Plot
     # =============================
     def show_plot(self):
-        self.model.plot_training(self.X, self.y)
+        """
+        Open a window with the SSE curve, updated live while training runs.
+        """
+
+        if self.plot_window is not None and self.plot_window.winfo_exists():
+            self.plot_window.lift()
+            return
+
+        self.plot_window = tk.Toplevel(self.root)
+        self.plot_window.title("Training Plot")
+
+        self.figure = Figure(figsize=(10, 4))
+        self.sse_ax = self.figure.add_subplot(1, 2, 1)
+        self.line_ax = self.figure.add_subplot(1, 2, 2)
+
+        self.sse_ax.set_xlabel("Iteration")
+        self.sse_ax.set_ylabel("SSE")
+        self.sse_ax.set_title("SSE over Iterations")
+        self.sse_ax.set_xlim(0, self.model.n_iters)
+
+        self.line_ax.scatter(self.X[:, 0], self.y)
+        self.line_ax.set_xlabel("X")
+        self.line_ax.set_ylabel("y")
+        self.line_ax.set_title("Regression Line")
+
+        # Animated artists are left out of the normal draw, and blitted on top
+        # of the saved background
+        self.sse_line, = self.sse_ax.plot([], [], animated=True)
+
+        self.canvas = FigureCanvasTkAgg(self.figure, master=self.plot_window)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+        self.sse_background = None
+
+        # Every draw, including the first, saves the background and blits the line
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+        self._full_redraw()
+
+        if self.trained:
+            self._draw_regression_line()
+
+    def _on_draw(self, event):
+        """
+        A full redraw (e.g. a window resize) clears the animated SSE line,
+        so save the new background and blit the line again, also when
+        training has already ended and nothing else would redraw it.
+        """
+
+        self._save_background()
+        self._blit_sse()
+
+    def _save_background(self):
+
+        self.sse_background = self.canvas.copy_from_bbox(self.sse_ax.bbox)
+
+    def _full_redraw(self):
+        """
+        Redraw the whole figure, e.g. after the axis limits changed.
+        The draw_event handler (_on_draw) then saves the clean background
+        and blits the SSE line.
+        """
+
+        if self.sse_values:
+            self.sse_ax.set_ylim(0, max(self.sse_values) * 1.05)
+
+        self.canvas.draw()
+
+    def _blit_sse(self):
+        """
+        Redraw only the SSE line on top of the saved background.
+        """
+
+        self.sse_line.set_data(self.sse_iters, self.sse_values)
+
+        self.canvas.restore_region(self.sse_background)
+        self.sse_ax.draw_artist(self.sse_line)
+        self.canvas.blit(self.sse_ax.bbox)
+
+    def _update_plot(self, force=False):
+
+        if self.plot_window is None or not self.plot_window.winfo_exists():
+            return
+
+        now = time.perf_counter()
+
+        # Frame rate cap
+        if not force and now - self.last_draw < 1 / self.MAX_FPS:
+            return
+
+        self.last_draw = now
+
+        low, high = self.sse_ax.get_ylim()
+
+        if self.sse_values and max(self.sse_values) > high:
+            self._full_redraw()
+        else:
+            self._blit_sse()
+
+        if force and self.trained:
+            self._draw_regression_line()
+
+    def _draw_regression_line(self):
+
+        X_line = np.sort(self.X[:, 0])
+        self.line_ax.plot(X_line, self.model.predict(X_line))
+
+        self._full_redraw()
 
 
 # Run App
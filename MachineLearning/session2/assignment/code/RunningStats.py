@@ -0,0 +1,160 @@
+import numpy as np
+
+
+"""
+RunningStats
+------------
+
+Streaming mean / variance (and optionally co-moments) of a dataset
+that arrives in chunks.
+
+Every chunk is summarized on its own and merged into the running
+totals with the parallel form of Welford's algorithm (Chan et al.):
+
+    n     = n_a + n_b
+    delta = mean_b - mean_a
+    mean  = mean_a + delta * n_b / n
+    M2    = M2_a + M2_b + delta² * n_a * n_b / n
+
+Unlike sum / sum-of-squares formulas this does not lose precision when
+the mean is large compared to the spread, and it never needs the whole
+dataset in memory.
+"""
+
+
+class RunningStats():
+
+    # A std at or below CONSTANT_TOL * max(1, |mean|) is rounding noise
+    # of a constant column, not real spread
+    CONSTANT_TOL = 1e-12
+
+    # Rows converted to float64 and centered at a time by update
+    BLOCK_ROWS = 16384
+
+    def __init__(self, covariance=False):
+        """
+        Parameters:
+        -----------
+        covariance : bool
+            If True, also track the full feature co-moment matrix,
+            the co-moment of every feature with the target and
+            the target's own mean / M2. Needed by LinearRegressionGD.fit_chunks.
+        """
+
+        self.covariance = covariance
+
+        self.n = 0
+        self.mean = None
+        self.m2 = None          # per-feature sum of squared deviations
+
+        # Only with covariance=True
+        self.comoment = None    # (X - mean)^T (X - mean)
+        self.mean_y = 0.0
+        self.m2_y = 0.0
+        self.comoment_xy = None # (X - mean)^T (y - mean_y)
+
+    def update(self, X, y=None):
+        """
+        Merge one chunk into the running statistics.
+
+        Large chunks are summarized in blocks of BLOCK_ROWS rows, so only
+        one block at a time is converted to float64 and centered; X itself
+        is never copied as a whole.
+
+        Parameters:
+        -----------
+        X : array-like of shape (n_rows, n_features)
+        y : array-like of shape (n_rows,), required when covariance=True
+        """
+
+        X = np.asarray(X)
+
+        if X.ndim < 2:
+            X = X.reshape(-1, 1)
+
+        if self.covariance:
+            if y is None:
+                raise ValueError("y is required when covariance=True")
+
+            y = np.asarray(y).reshape(-1)
+
+        for start in range(0, X.shape[0], self.BLOCK_ROWS):
+            stop = start + self.BLOCK_ROWS
+            self._merge(X[start:stop], None if y is None else y[start:stop])
+
+        return self
+
+    def _merge(self, X, y):
+        """
+        Summarize one block of rows and merge it into the totals.
+        """
+
+        X = np.asarray(X, dtype=float)
+        n_b = X.shape[0]
+
+        mean_b = X.mean(axis=0)
+        centered = X - mean_b
+        m2_b = np.einsum("ij,ij->j", centered, centered)
+
+        if self.covariance:
+            y = np.asarray(y, dtype=float)
+            mean_y_b = y.mean()
+            centered_y = y - mean_y_b
+
+            comoment_b = centered.T @ centered
+            comoment_xy_b = centered.T @ centered_y
+            m2_y_b = np.dot(centered_y, centered_y)
+
+        if self.n == 0:
+
+            self.n = n_b
+            self.mean = mean_b
+            self.m2 = m2_b
+
+            if self.covariance:
+                self.comoment = comoment_b
+                self.comoment_xy = comoment_xy_b
+                self.mean_y = mean_y_b
+                self.m2_y = m2_y_b
+
+            return
+
+        n_a = self.n
+        n = n_a + n_b
+        weight = n_a * n_b / n
+
+        delta = mean_b - self.mean
+
+        self.mean = self.mean + delta * (n_b / n)
+        self.m2 = self.m2 + m2_b + delta ** 2 * weight
+
+        if self.covariance:
+            delta_y = mean_y_b - self.mean_y
+
+            self.comoment = self.comoment + comoment_b + np.outer(delta, delta) * weight
+            self.comoment_xy = self.comoment_xy + comoment_xy_b + delta * delta_y * weight
+            self.m2_y = self.m2_y + m2_y_b + delta_y ** 2 * weight
+            self.mean_y = self.mean_y + delta_y * (n_b / n)
+
+        self.n = n
+
+    @property
+    def var(self):
+        """
+        Population variance of every feature.
+        """
+        return self.m2 / self.n
+
+    @property
+    def std(self):
+        """
+        Population standard deviation of every feature.
+
+        Constant columns get std = 1, so dividing by it only centers them
+        instead of producing inf / nan. The test is relative to the mean:
+        depending on how the data was chunked, a constant column can come
+        out with a tiny non-zero std from rounding (e.g. 1e-17 for 0.1).
+        """
+        std = np.sqrt(self.var)
+        std[std <= self.CONSTANT_TOL * np.maximum(1.0, np.abs(self.mean))] = 1.0
+        return std
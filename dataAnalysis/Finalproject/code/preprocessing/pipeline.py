@@ -12,12 +12,14 @@ except ImportError:
     from preprocessor import BikeSharePreprocessor
 
 
-def run_bikeshare_pipeline(file_path):
+def run_bikeshare_pipeline(file_path, columns=None):
     """
     This function executes the full preprocessing pipeline and returns the prepared datasets.
 
     Parameters:
     file_path (str): Path to the CSV data file
+    columns (list or str): Columns to load, passed to load_data
+        (None = all, "pipeline" = only the ones the preprocessing uses)
 
     Returns:
     tuple: (df_clean, df_processed)
@@ -29,7 +31,7 @@ def run_bikeshare_pipeline(file_path):
     preprocessor = BikeSharePreprocessor(file_path)
 
     # 2. Execute preprocessing steps in sequence (Pipeline call)
-    (preprocessor.load_data()
+    (preprocessor.load_data(columns)
                  .clean_data()
                  .engineer_features()
                  .encode_and_scale())
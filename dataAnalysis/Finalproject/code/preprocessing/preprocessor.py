@@ -10,8 +10,26 @@ Responsibilities:
 - Engineer features
 - Encode and scale data
 - Provide processed dataset
+
+Loading cache:
+The first load_data() converts the CSV into a typed columnar cache file
+next to it (Parquet when pyarrow is installed, otherwise a pandas pickle).
+Later runs read the cache, and with Parquet only the requested columns.
+The cache is tied to the CSV's modification time, size and SHA-256 hash,
+so an edited CSV is converted again.
+
+Column types:
+The CSV is read with the declared SCHEMA instead of inferred types:
+categories for the repeated strings, small integers for the IDs,
+float32 coordinates and parsed timestamps. This makes the DataFrame
+several times smaller before cleaning starts.
 """
 
+import hashlib
+import importlib.util
+import json
+import os
+
 import pandas as pd
 import numpy as np
 
@@ -21,28 +39,91 @@ class BikeSharePreprocessor:
     Pipeline class to process BikeShare dataset step by step.
     """
 
-    def __init__(self, file_path):
+    # Columns used by clean_data, engineer_features and encode_and_scale
+    PIPELINE_COLUMNS = [
+        'duration_sec',
+        'start_time',
+        'start_station_id',
+        'end_station_id',
+        'user_type',
+        'member_birth_year',
+        'member_gender',
+        'bike_share_for_all_trip'
+    ]
+
+    # Column types applied when the CSV is read. IDs and birth years can be
+    # missing, so they use the nullable integer types (Int16/Int32).
+    SCHEMA = {
+        'duration_sec': 'int32',
+        'start_station_id': 'Int16',
+        'start_station_name': 'category',
+        'start_station_latitude': 'float32',
+        'start_station_longitude': 'float32',
+        'end_station_id': 'Int16',
+        'end_station_name': 'category',
+        'end_station_latitude': 'float32',
+        'end_station_longitude': 'float32',
+        'bike_id': 'Int32',
+        'user_type': 'category',
+        'member_birth_year': 'Int16',
+        'member_gender': 'category',
+        'bike_share_for_all_trip': 'category'
+    }
+
+    # Parsed to datetime64 while reading
+    DATETIME_COLUMNS = ['start_time', 'end_time']
+
+    # Bump when the cached table changes, so old cache files are rebuilt
+    CACHE_VERSION = 2
+
+    def __init__(self, file_path, use_cache=True, cache_dir=None):
         """
         Initialize pipeline with dataset path.
 
         Parameters:
         file_path (str): path to CSV file
+        use_cache (bool): read/write the columnar cache of the CSV
+        cache_dir (str): folder for the cache files (default: next to the CSV)
         """
 
         self.file_path = file_path
+        self.use_cache = use_cache
+        self.cache_dir = cache_dir
         self.df = None
         self.df_processed = None
 
 
-    def load_data(self):
+    def load_data(self, columns=None):
         """
-        Load dataset from CSV file.
+        Load dataset from CSV file (or from its cache).
+
+        Parameters:
+        columns (list or str): columns to load, None for all of them, or
+            "pipeline" for PIPELINE_COLUMNS. Note that clean_data removes
+            duplicate rows over the loaded columns only.
 
         Returns:
         self: allows method chaining
         """
 
-        self.df = pd.read_csv(self.file_path, low_memory=False)
+        if columns == "pipeline":
+            columns = self.PIPELINE_COLUMNS
+
+        df = self._read_cache(columns) if self.use_cache else None
+
+        if df is None:
+
+            if self.use_cache:
+                # The cache holds every column, later runs pick from it
+                df = self._read_csv()
+                self._write_cache(df)
+
+                if columns is not None:
+                    df = df[list(columns)]
+            else:
+                df = self._read_csv(columns)
+
+        self.df = df
 
         if self.df is None or self.df.empty:
             raise ValueError("Dataset failed to load or is empty.")
@@ -52,6 +133,129 @@ class BikeSharePreprocessor:
         return self
 
 
+    def _read_csv(self, columns=None):
+        """
+        Read the CSV with the declared SCHEMA and DATETIME_COLUMNS.
+
+        Columns of the file that are not in the schema keep inferred types.
+        """
+
+        header = pd.read_csv(self.file_path, nrows=0).columns
+        wanted = header if columns is None else [col for col in header if col in columns]
+
+        return pd.read_csv(
+            self.file_path,
+            usecols=None if columns is None else list(columns),
+            dtype={col: dtype for col, dtype in self.SCHEMA.items() if col in wanted},
+            parse_dates=[col for col in self.DATETIME_COLUMNS if col in wanted],
+            low_memory=False
+        )
+
+
+    def _cache_paths(self):
+        """
+        Return (cache file, metadata file) paths and the cache format.
+        """
+
+        cache_format = "parquet" if importlib.util.find_spec("pyarrow") else "pickle"
+
+        folder = self.cache_dir or os.path.dirname(os.path.abspath(self.file_path))
+        stem = os.path.splitext(os.path.basename(self.file_path))[0]
+        base = os.path.join(folder, f"{stem}.cache")
+
+        return f"{base}.{cache_format}", f"{base}.json", cache_format
+
+
+    def _file_hash(self):
+        """
+        SHA-256 of the CSV, read in 8 MB blocks.
+        """
+
+        digest = hashlib.sha256()
+
+        with open(self.file_path, 'rb') as f:
+            for block in iter(lambda: f.read(8 * 1024 * 1024), b''):
+                digest.update(block)
+
+        return digest.hexdigest()
+
+
+    def _read_cache(self, columns):
+        """
+        Return the cached table, or None when there is no valid cache.
+
+        The hash is only computed when the CSV's mtime or size changed,
+        so an unchanged file is not read at all.
+        """
+
+        cache_path, meta_path, cache_format = self._cache_paths()
+
+        if not (os.path.exists(cache_path) and os.path.exists(meta_path)):
+            return None
+
+        with open(meta_path) as f:
+            meta = json.load(f)
+
+        stat = os.stat(self.file_path)
+
+        if meta.get('version') != self.CACHE_VERSION or meta.get('format') != cache_format:
+            return None
+
+        if meta.get('mtime_ns') != stat.st_mtime_ns or meta.get('size') != stat.st_size:
+
+            if meta.get('size') != stat.st_size or meta.get('sha256') != self._file_hash():
+                return None
+
+            # Same content, only touched: remember the new mtime
+            meta['mtime_ns'] = stat.st_mtime_ns
+            with open(meta_path, 'w') as f:
+                json.dump(meta, f)
+
+        if cache_format == "parquet":
+            df = pd.read_parquet(cache_path, columns=None if columns is None else list(columns))
+        else:
+            df = pd.read_pickle(cache_path)
+            if columns is not None:
+                df = df[list(columns)]
+
+        print("Loaded from cache:", cache_path)
+
+        return df
+
+
+    def _write_cache(self, df):
+        """
+        Store the freshly read table as the cache of the CSV.
+        A failure only prints a warning, the data is still used.
+        """
+
+        cache_path, meta_path, cache_format = self._cache_paths()
+        stat = os.stat(self.file_path)
+
+        meta = {
+            'version': self.CACHE_VERSION,
+            'format': cache_format,
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'sha256': self._file_hash()
+        }
+
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+
+            if cache_format == "parquet":
+                df.to_parquet(cache_path, index=False)
+            else:
+                df.to_pickle(cache_path)
+
+            # Metadata last: a cache file without it is never used
+            with open(meta_path, 'w') as f:
+                json.dump(meta, f)
+
+        except (OSError, ValueError, TypeError, ImportError) as error:
+            print(f"Warning: could not write the cache ({error}).")
+
+
     def clean_data(self):
         """
         Clean dataset and fix data quality issues.
@@ -65,6 +269,7 @@ class BikeSharePreprocessor:
         - Remove unrealistic ages
         - Remove duplicates
         - Remove duration outliers using IQR
+        - Drop categories that no row uses anymore
         """
 
         df = self.df.copy()
@@ -112,6 +317,11 @@ class BikeSharePreprocessor:
             (df['duration_sec'] <= upper)
         ]
 
+        # Categories whose rows were dropped above would otherwise still
+        # show up in get_dummies (and shift which one drop_first removes)
+        for col in df.select_dtypes('category').columns:
+            df[col] = df[col].cat.remove_unused_categories()
+
         self.df = df
 
         print("Shape after cleaning:", df.shape)